@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import json
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import sqlite3
@@ -101,7 +101,7 @@ def _log_event(conn: sqlite3.Connection, user: str, action: str, payload: Dict[s
     conn.execute(
         "INSERT INTO events (occurred_at, user, action, payload) VALUES (?, ?, ?, ?)",
         (
-            datetime.utcnow().strftime(ISO_FORMAT),
+            datetime.now(timezone.utc).strftime(ISO_FORMAT),
             user,
             action,
             json.dumps(payload, ensure_ascii=False),
@@ -110,7 +110,7 @@ def _log_event(conn: sqlite3.Connection, user: str, action: str, payload: Dict[s
 
 
 def generate_consignment_ref() -> str:
-    return f"CONS-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+    return f"CONS-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
 
 
 def create_consignment(
@@ -124,7 +124,7 @@ def create_consignment(
         raise ValueError("Partner name is required")
 
     ref = consignment_ref or generate_consignment_ref()
-    created_at = datetime.utcnow().strftime(ISO_FORMAT)
+    created_at = datetime.now(timezone.utc).strftime(ISO_FORMAT)
 
     with transaction() as conn:
         cursor = conn.execute(
@@ -320,7 +320,7 @@ def process_scan(
                 raise ValueError("Selected consignment not found")
             consignment = dict(row)
 
-    scanned_at = datetime.utcnow().strftime(ISO_FORMAT)
+    scanned_at = datetime.now(timezone.utc).strftime(ISO_FORMAT)
 
     with transaction() as conn:
         cursor = conn.execute(
@@ -5,7 +5,7 @@ import json
 import logging
 import threading
 from collections import deque
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Deque, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from core import app_paths
@@ -45,7 +45,7 @@ def record(
 
     if not field_diffs:
         return
-    timestamp = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     payload: Dict[str, object] = {
         "row_id": row_id,
         "fields": {key: list(value) for key, value in field_diffs.items()},
@@ -1,12 +1,13 @@
 """Google Drive API helpers for RugBase synchronization."""
 from __future__ import annotations
 
+import hashlib
 import io
 import json
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
 
 try:  # pragma: no cover - optional dependency guard
     from googleapiclient.discovery import build
@@ -29,6 +30,11 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_SCOPES = ["https://www.googleapis.com/auth/drive.file"]
 FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+# Passed to ``execute``/``next_chunk``: the client library retries 429 and 5xx
+# responses this many times with randomised exponential backoff.  Only
+# idempotent calls use it; a create or copy retried after a 5xx the server
+# had already committed would leave a duplicate file behind.
+NUM_RETRIES = 4
 
 
 class GoogleClientUnavailable(RuntimeError):
@@ -140,7 +146,7 @@ def ensure_folder(service, name: str, parent_id: Optional[str] = None) -> str:
     response = (
         service.files()
         .list(q=query, spaces="drive", fields="files(id, name)")
-        .execute()
+        .execute(num_retries=NUM_RETRIES)
     )
     files = response.get("files", [])
     if files:
@@ -165,7 +171,7 @@ def ensure_structure(
     root_id = root_folder_id
     if root_id:
         try:
-            service.files().get(fileId=root_id, fields="id").execute()
+            service.files().get(fileId=root_id, fields="id").execute(num_retries=NUM_RETRIES)
         except HttpError:
             root_id = None
     if not root_id:
@@ -232,7 +238,7 @@ def list_files(service, parent_id: str, since_datetime: Optional[datetime] = Non
                 orderBy="createdTime",
                 pageToken=page_token,
             )
-            .execute()
+            .execute(num_retries=NUM_RETRIES)
         )
         files.extend(response.get("files", []))
         page_token = response.get("nextPageToken")
@@ -245,13 +251,48 @@ def list_files(service, parent_id: str, since_datetime: Optional[datetime] = Non
 def download_file(service, file_id: str) -> bytes:
     """Download a file's content as bytes."""
 
+    buffer = io.BytesIO()
+    _download_into(service, file_id, buffer)
+    return buffer.getvalue()
+
+
+class _HashingWriter:
+    """File-like sink that hashes every chunk before passing it on."""
+
+    def __init__(self, target: Optional[BinaryIO]) -> None:
+        self.digest = hashlib.sha256()
+        self._target = target
+
+    def write(self, data: bytes) -> int:
+        self.digest.update(data)
+        if self._target is not None:
+            self._target.write(data)
+        return len(data)
+
+
+def download_sha256(service, file_id: str, path: Optional[str] = None) -> str:
+    """Stream a file from Drive and return the SHA-256 hex digest of its content.
+
+    When ``path`` is given the content is written there as it arrives, so the
+    file is neither buffered in memory nor read back to be hashed.
+    """
+
+    if path is None:
+        writer = _HashingWriter(None)
+        _download_into(service, file_id, writer)
+        return writer.digest.hexdigest()
+    with open(path, "wb") as handle:
+        writer = _HashingWriter(handle)
+        _download_into(service, file_id, writer)
+    return writer.digest.hexdigest()
+
+
+def _download_into(service, file_id: str, sink) -> None:
     _ensure_google_client()
     request = service.files().get_media(fileId=file_id)
-    buffer = io.BytesIO()
     from googleapiclient.http import MediaIoBaseDownload  # Imported lazily to avoid optional dependency issues
 
-    downloader = MediaIoBaseDownload(buffer, request)
+    downloader = MediaIoBaseDownload(sink, request)
     done = False
     while not done:
-        _, done = downloader.next_chunk()
-    return buffer.getvalue()
+        _, done = downloader.next_chunk(num_retries=NUM_RETRIES)
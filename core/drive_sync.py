@@ -11,7 +11,7 @@ import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, NoReturn
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, NoReturn
 import tempfile
 from stat import S_IRUSR, S_IWUSR
 import site
@@ -205,7 +205,7 @@ class SyncResult:
 
 
 def _now() -> datetime:
-    return datetime.utcnow().replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc)
 
 
 def _format_iso(dt: datetime) -> str:
@@ -302,6 +302,19 @@ def _settings_path() -> Path:
     return app_paths.config_path(SETTINGS_FILENAME)
 
 
+# (mtime_ns, size) of the settings file and the settings load_settings built
+# from it; reused until the file changes or save_settings runs.
+_SETTINGS_CACHE: Optional[Tuple[Tuple[int, int], Dict[str, object]]] = None
+
+
+def _settings_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _default_settings() -> Dict[str, object]:
     return {
         "client_secret_path": "",
@@ -323,7 +336,12 @@ def _default_settings() -> Dict[str, object]:
 
 
 def load_settings() -> Dict[str, object]:
+    global _SETTINGS_CACHE
+
     path = _settings_path()
+    cached = _SETTINGS_CACHE
+    if cached is not None and cached[0] == _settings_stamp(path):
+        return dict(cached[1])
     defaults = _default_settings()
     if path.exists():
         with path.open("r", encoding="utf-8") as handle:
@@ -364,10 +382,15 @@ def load_settings() -> Dict[str, object]:
     defaults.setdefault("service_account_email", DEFAULT_SERVICE_ACCOUNT_EMAIL)
     defaults.setdefault("spreadsheet_url", DEFAULT_SPREADSHEET_URL)
     defaults.setdefault("private_key_id", DEFAULT_PRIVATE_KEY_ID)
+    stamp = _settings_stamp(path)
+    _SETTINGS_CACHE = (stamp, dict(defaults)) if stamp is not None else None
     return defaults
 
 
 def save_settings(settings: Dict[str, object]) -> None:
+    global _SETTINGS_CACHE
+
+    _SETTINGS_CACHE = None
     path = _settings_path()
     token_path = _ensure_token_directory(str(settings.get("token_path") or _default_token_path()))
     settings["token_path"] = token_path
@@ -379,9 +402,27 @@ def save_settings(settings: Dict[str, object]) -> None:
         raise
     else:
         settings["client_secret_path"] = secret_path
+    payload = json.dumps(settings, indent=2, ensure_ascii=False).encode("utf-8")
+    try:
+        if path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(settings, handle, indent=2, ensure_ascii=False)
+    # Write beside the target and swap it in so a crash never leaves a
+    # truncated settings file behind.  The UI and the sync thread may save at
+    # the same time, so every save writes its own temporary file.
+    handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as temp_file:
+            temp_file.write(payload)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
 
 
 def get_poll_interval() -> int:
@@ -418,12 +459,16 @@ def _create_service(settings: Dict[str, object]):
 
 def _ensure_structure(service) -> Tuple[str, str, str]:
     root_id = ROOT_FOLDER_ID
-    service.files().get(fileId=root_id, fields="id").execute()
+    service.files().get(fileId=root_id, fields="id").execute(num_retries=drive_api.NUM_RETRIES)
     changelog_id = drive_api.ensure_folder(service, CHANGELOG_FOLDER_NAME, parent_id=root_id)
     backups_id = drive_api.ensure_folder(service, BACKUPS_FOLDER_NAME, parent_id=root_id)
     return root_id, changelog_id, backups_id
 
 
+def _is_not_found(exc: Exception) -> bool:
+    return getattr(getattr(exc, "resp", None), "status", None) == 404
+
+
 def test_connection(candidate_settings: Dict[str, object]) -> Dict[str, str]:
     settings = load_settings()
     settings.update(candidate_settings)
@@ -452,6 +497,18 @@ class DriveSync:
         with self._lock:
             if self._service is None:
                 self._service = _create_service(settings)
+        known = (
+            settings.get("root_folder_id"),
+            settings.get("changelog_folder_id"),
+            settings.get("backups_folder_id"),
+        )
+        if known[0] == ROOT_FOLDER_ID and all(known):
+            # Folders resolved by an earlier sync; looking them up again costs
+            # three Drive round-trips per operation.  A stale ID is dropped by
+            # _in_backups_folder when Drive reports the folder missing.
+            structure = {"root": str(known[0]), "changelog": str(known[1]), "backups": str(known[2])}
+            self._structure = structure
+            return self._service, structure
         root_id, changelog_id, backups_id = _ensure_structure(self._service)
         structure = {"root": root_id, "changelog": changelog_id, "backups": backups_id}
         if self._structure != structure:
@@ -470,7 +527,46 @@ class DriveSync:
             save_settings(settings)
         return self._service, structure
 
-    def _fetch_remote_metadata(self, service) -> Optional[Dict[str, object]]:
+    def _in_backups_folder(
+        self,
+        settings: Dict[str, object],
+        structure: Dict[str, str],
+        action: Callable[[str], Any],
+    ) -> Any:
+        """Run ``action(backups_folder_id)``, re-resolving the folders once on 404.
+
+        _ensure_client trusts folder IDs stored in settings; this is the
+        recovery path for when that folder was deleted or trashed on Drive.
+        """
+
+        try:
+            return action(structure["backups"])
+        except drive_api.HttpError as exc:
+            if not _is_not_found(exc):
+                raise
+        logger.warning("[Drive] Stored backups folder is gone; resolving the folders again")
+        settings["changelog_folder_id"] = None
+        settings["backups_folder_id"] = None
+        _, structure = self._ensure_client(settings)
+        return action(structure["backups"])
+
+    def _fetch_remote_metadata(self, service, file_id: Optional[object] = None) -> Optional[Dict[str, object]]:
+        if file_id:
+            # The ID remembered from the last sync is a direct lookup rather
+            # than a folder search; fall back to the search when the file was
+            # trashed, moved or deleted.
+            try:
+                metadata = (
+                    service.files()
+                    .get(fileId=str(file_id), fields="id, name, modifiedTime, appProperties, parents, trashed")
+                    .execute(num_retries=drive_api.NUM_RETRIES)
+                )
+            except drive_api.HttpError:
+                metadata = None
+            if metadata and not metadata.get("trashed") and ROOT_FOLDER_ID in (metadata.get("parents") or ()):
+                metadata.pop("trashed", None)
+                metadata.pop("parents", None)
+                return metadata
         query = (
             f"name = '{DB_FILENAME}' and '{ROOT_FOLDER_ID}' in parents and trashed = false"
         )
@@ -482,7 +578,7 @@ class DriveSync:
                 fields="files(id, name, modifiedTime, appProperties)",
                 pageSize=1,
             )
-            .execute()
+            .execute(num_retries=drive_api.NUM_RETRIES)
         )
         files = response.get("files", [])
         if not files:
@@ -495,21 +591,13 @@ class DriveSync:
         if existing_hash:
             return existing_hash, metadata
         file_id = metadata["id"]
-        raw_bytes = drive_api.download_file(service, file_id)
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        try:
-            temp_file.write(raw_bytes)
-            temp_file.flush()
-        finally:
-            temp_file.close()
-        computed_hash = file_sha256(temp_file.name)
+        computed_hash = drive_api.download_sha256(service, file_id)
         service.files().update(
             fileId=file_id,
             body={"appProperties": {"sha256": computed_hash}},
             fields="id, appProperties",
-        ).execute()
+        ).execute(num_retries=drive_api.NUM_RETRIES)
         metadata["appProperties"] = {"sha256": computed_hash}
-        os.remove(temp_file.name)
         return computed_hash, metadata
 
     def _upload_local(self, service, file_id: Optional[str], structure: Dict[str, str], settings: Dict[str, object]) -> Tuple[str, Dict[str, object]]:
@@ -520,7 +608,7 @@ class DriveSync:
             updated = (
                 service.files()
                 .update(fileId=file_id, body=body, media_body=media, fields="id, modifiedTime, appProperties")
-                .execute()
+                .execute(num_retries=drive_api.NUM_RETRIES)
             )
         else:
             body["parents"] = [structure["root"]]
@@ -538,11 +626,13 @@ class DriveSync:
         return local_hash, updated
 
     def _download_remote(self, service, file_id: str, settings: Dict[str, object]) -> Tuple[str, Dict[str, object]]:
-        raw_bytes = drive_api.download_file(service, file_id)
         temp_path = Path(tempfile.gettempdir()) / f"rugbase_download_{os.getpid()}"
-        with open(temp_path, "wb") as handle:
-            handle.write(raw_bytes)
-        temp_hash = file_sha256(temp_path)
+        try:
+            temp_hash = drive_api.download_sha256(service, file_id, str(temp_path))
+        except BaseException:
+            # Do not leave a partial download behind in the temp directory.
+            temp_path.unlink(missing_ok=True)
+            raise
         shutil.move(temp_path, self.db_path)
         metadata = (
             service.files()
@@ -551,7 +641,7 @@ class DriveSync:
                 body={"appProperties": {"sha256": temp_hash}},
                 fields="id, modifiedTime, appProperties",
             )
-            .execute()
+            .execute(num_retries=drive_api.NUM_RETRIES)
         )
         settings["last_local_hash"] = temp_hash
         settings["last_remote_hash"] = temp_hash
@@ -561,14 +651,18 @@ class DriveSync:
         save_settings(settings)
         return temp_hash, metadata
 
-    def _copy_to_backups(self, service, file_id: str, structure: Dict[str, str]) -> None:
+    def _copy_to_backups(self, service, file_id: str, structure: Dict[str, str], settings: Dict[str, object]) -> None:
         timestamp = _now().strftime("%Y%m%dT%H%M%SZ")
         backup_name = f"rugbase_conflict_{timestamp}.db"
-        service.files().copy(
-            fileId=file_id,
-            body={"name": backup_name, "parents": [structure["backups"]]},
-            fields="id",
-        ).execute()
+        self._in_backups_folder(
+            settings,
+            structure,
+            lambda folder_id: service.files().copy(
+                fileId=file_id,
+                body={"name": backup_name, "parents": [folder_id]},
+                fields="id",
+            ).execute(),
+        )
 
     def _backup_local_copy(self) -> Optional[Path]:
         if not self.db_path.exists():
@@ -615,7 +709,7 @@ class DriveSync:
         local_mtime = datetime.fromtimestamp(self.db_path.stat().st_mtime, timezone.utc) if local_exists else None
         local_hash = file_sha256(self.db_path) if local_exists else None
 
-        metadata = self._fetch_remote_metadata(service)
+        metadata = self._fetch_remote_metadata(service, settings.get("remote_file_id"))
         if not metadata:
             if not local_exists:
                 message = "No database found locally or on Drive."
@@ -670,7 +764,7 @@ class DriveSync:
         if local_changed and remote_changed:
             backup_path = self._backup_local_copy()
             try:
-                self._copy_to_backups(service, file_id, structure)
+                self._copy_to_backups(service, file_id, structure, settings)
             except Exception:  # pragma: no cover - defensive
                 logger.warning("[Drive] Remote conflict backup could not be created", exc_info=True)
             self._log_conflict(settings, local_hash, remote_hash, local_mtime, remote_mtime)
@@ -719,11 +813,15 @@ class DriveSync:
         timestamp = _now().strftime("%Y%m%dT%H%M%SZ")
         archive_name = f"rugbase_backup_{timestamp}.db"
         media = drive_api.MediaFileUpload(str(self.db_path), mimetype="application/octet-stream", resumable=False)
-        service.files().create(
-            body={"name": archive_name, "parents": [structure["backups"]]},
-            media_body=media,
-            fields="id",
-        ).execute()
+        self._in_backups_folder(
+            settings,
+            structure,
+            lambda folder_id: service.files().create(
+                body={"name": archive_name, "parents": [folder_id]},
+                media_body=media,
+                fields="id",
+            ).execute(),
+        )
         settings["last_sync_time"] = _format_iso(_now())
         save_settings(settings)
         return archive_name
@@ -732,7 +830,7 @@ class DriveSync:
         settings = self._reload_settings()
         _ensure_configured(settings)
         service, structure = self._ensure_client(settings)
-        metadata = self._fetch_remote_metadata(service)
+        metadata = self._fetch_remote_metadata(service, settings.get("remote_file_id"))
         if not metadata:
             raise RuntimeError("No remote database found to resolve the conflict.")
         file_id = metadata.get("id")
@@ -761,7 +859,7 @@ class DriveSync:
         settings = self._reload_settings()
         _ensure_configured(settings)
         service, _ = self._ensure_client(settings)
-        metadata = self._fetch_remote_metadata(service)
+        metadata = self._fetch_remote_metadata(service, settings.get("remote_file_id"))
         if not metadata:
             raise FileNotFoundError("No remote database is available to restore.")
         file_id = metadata.get("id")
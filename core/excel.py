@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Iterable, List
 from xml.sax.saxutils import escape
 import zipfile
@@ -74,7 +74,7 @@ class Workbook:
         self.active = Worksheet()
 
     def save(self, filename: str) -> None:
-        timestamp = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
         core_properties = _CORE_PROPERTIES_TEMPLATE.format(timestamp=timestamp)
         worksheet_xml = self.active.render()
@@ -74,7 +74,12 @@ class ExcelValuesApi:
     def __init__(self, workbook_path: Path) -> None:
         self._workbook_path = workbook_path
 
-    def get(self, spreadsheetId: str, range: str) -> _ExcelRequest:  # noqa: N803 - API compatibility
+    def get(  # noqa: N803 - API compatibility
+        self,
+        spreadsheetId: str,
+        range: str,
+        fields: str | None = None,
+    ) -> _ExcelRequest:
         return _ExcelRequest(lambda: self._handle_get(range))
 
     def batchGet(  # noqa: N802 - API compatibility
@@ -182,6 +187,7 @@ class ExcelSpreadsheetsApi:
         spreadsheetId: str,
         includeGridData: bool = False,
         ranges: Iterable[str] | None = None,
+        fields: str | None = None,
     ) -> _ExcelRequest:
         def _noop() -> Mapping[str, object]:
             path = self._workbook_path
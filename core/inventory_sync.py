@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Callable, Dict, Iterable, List, Optional
@@ -13,12 +14,16 @@ from core.sheets_client import SheetsClientError
 
 logger = logging.getLogger(__name__)
 
+# A burst of local edits is synced once, after edits pause for this long ...
+EDIT_DEBOUNCE_SECONDS = 1.5
+# ... but never later than this after the first edit of the burst.
+EDIT_DEBOUNCE_MAX_SECONDS = 10.0
+
 
 def _utc_now_iso() -> str:
     return (
-        datetime.utcnow()
+        datetime.now(timezone.utc)
         .replace(microsecond=0)
-        .replace(tzinfo=timezone.utc)
         .isoformat()
         .replace("+00:00", "Z")
     )
@@ -71,6 +76,9 @@ class InventorySyncManager:
         self._last_sync: Optional[str] = None
         self._pending = 0
         self._poll_interval = poll_interval
+        self._last_edit = 0.0
+        # Set by sync_now so an explicit request skips the edit debounce.
+        self._sync_requested = False
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -92,6 +100,7 @@ class InventorySyncManager:
         self._thread = None
 
     def sync_now(self) -> None:
+        self._sync_requested = True
         self._wake_event.set()
 
     def load_initial_snapshot(self) -> bool:
@@ -114,6 +123,9 @@ class InventorySyncManager:
     def _run_loop(self) -> None:
         while not self._stop_event.is_set():
             triggered = self._wake_event.wait(timeout=self._poll_interval)
+            if triggered and not self._sync_requested:
+                self._settle_edits()
+            self._sync_requested = False
             self._wake_event.clear()
             try:
                 self._sync_once(force_pull=triggered)
@@ -121,6 +133,17 @@ class InventorySyncManager:
                 logger.exception("Background sync cycle failed")
                 self._set_offline("Synchronization error")
 
+    def _settle_edits(self) -> None:
+        """Wait for a burst of local edits to pause so it costs one sync."""
+
+        deadline = time.monotonic() + EDIT_DEBOUNCE_MAX_SECONDS
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            quiet = now - self._last_edit
+            if self._sync_requested or quiet >= EDIT_DEBOUNCE_SECONDS or now >= deadline:
+                return
+            self._stop_event.wait(min(EDIT_DEBOUNCE_SECONDS - quiet, deadline - now))
+
     def _notify_status(
         self,
         *,
@@ -164,6 +187,7 @@ class InventorySyncManager:
             self._notify_status()
 
     def _on_item_upsert(self, item_id: str) -> None:
+        self._last_edit = time.monotonic()
         self._wake_event.set()
         self._pending = 0
 
@@ -227,7 +227,11 @@ class GoogleSheetsClient:
         try:
             metadata = (
                 self._service.spreadsheets()
-                .get(spreadsheetId=self._spreadsheet_id, includeGridData=False, ranges=[])
+                .get(
+                    spreadsheetId=self._spreadsheet_id,
+                    includeGridData=False,
+                    fields="sheets.properties.title",
+                )
                 .execute()
             )
         except HttpError as exc:
@@ -13,7 +13,8 @@ operations required by the importer/exporter tools:
 ``upsert_rows``
     Insert or update a batch of local rows, applying validation rules for the
     Status field and making sure numeric values are written as numbers.  The
-    sheet header row is normalised before the data is uploaded.
+    sheet header row is normalised before the data is uploaded and only the
+    touched rows are written back.
 
 ``delete_rows``
     Remove rows identified by RugNo or UPC and rewrite the worksheet.
@@ -91,12 +92,15 @@ REQUIRED_HEADERS: Tuple[str, ...] = (
     "Hash",
     "Deleted",
 )
+# List form of REQUIRED_HEADERS, comparable with header rows read from the API.
+_REQUIRED_HEADER_LIST: List[str] = list(REQUIRED_HEADERS)
 
 FLOAT_COLUMNS = {"Area", "Retail", "SP", "MSRP", "Cost", "Rate", "Amount"}
 INT_COLUMNS: Set[str] = {"Qty"}
 DATETIME_COLUMNS = {"UpdatedAt"}
 BOOL_COLUMNS = {"Deleted"}
 UPSERT_KEYS = ("RugNo", "UPC")
+_TYPED_COLUMNS = FLOAT_COLUMNS | INT_COLUMNS | DATETIME_COLUMNS | BOOL_COLUMNS
 
 MAX_BATCH_CELLS = 1_000
 ROW_FETCH_CHUNK = 2_000
@@ -198,6 +202,9 @@ def _a1_range(worksheet_title: str, range_spec: str) -> str:
 
 
 def _normalise_headers(existing: Sequence[str]) -> List[str]:
+    if existing == _REQUIRED_HEADER_LIST:
+        # Common case: the sheet already carries exactly the required row.
+        return list(existing)
     extras: List[str] = []
     seen = set()
     for header in existing:
@@ -313,7 +320,7 @@ def _ensure_header_row(service, spreadsheet_id: str, worksheet_title: str = SHEE
     request = (
         service.spreadsheets()
         .values()
-        .get(spreadsheetId=spreadsheet_id, range=_a1_range(worksheet_title, "1:1"))
+        .get(spreadsheetId=spreadsheet_id, range=_a1_range(worksheet_title, "1:1"), fields="values")
     )
     result = request.execute()
     existing = result.get("values", []) if isinstance(result, dict) else []
@@ -368,12 +375,19 @@ def _fetch_values(
 
 
 def _rows_from_values(headers: Sequence[str], values: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    width = len(headers)
+    # Text columns only map blanks to ``None``; the rest go through the
+    # full conversion.
+    typed_headers = [header for header in headers if header in _TYPED_COLUMNS]
     rows: List[Dict[str, Any]] = []
     for raw in values:
-        row: Dict[str, Any] = {}
-        for index, header in enumerate(headers):
-            cell = raw[index] if index < len(raw) else ""
-            row[header] = _coerce_from_sheet(header, cell)
+        if len(raw) < width:
+            raw = list(raw) + [""] * (width - len(raw))
+        row = {header: None if cell == "" else cell for header, cell in zip(headers, raw)}
+        for header in typed_headers:
+            value = row[header]
+            if value is not None:
+                row[header] = _coerce_from_sheet(header, value)
         rows.append(row)
     return rows
 
@@ -427,8 +441,12 @@ def _write_sheet(
     headers: Sequence[str],
     rows: Sequence[Mapping[str, Any]],
     worksheet_title: str = SHEET_NAME,
+    *,
+    blank_rows: int = 0,
 ) -> None:
     matrix = [list(headers)] + _format_rows_for_sheet(headers, rows)
+    # Values updates never shrink the sheet; blank out rows left behind.
+    matrix.extend([""] * len(headers) for _ in range(blank_rows))
     end_column = _column_letter(len(headers))
     data: List[Dict[str, Any]] = []
     for start, chunk in _chunk_rows(matrix):
@@ -460,6 +478,52 @@ def _write_sheet(
     )
 
 
+def _write_positions(
+    service,
+    spreadsheet_id: str,
+    headers: Sequence[str],
+    rows: Sequence[Mapping[str, Any]],
+    positions: Iterable[int],
+    worksheet_title: str = SHEET_NAME,
+) -> None:
+    """Rewrite only ``rows[position]`` for each of ``positions``.
+
+    Consecutive positions share one range, split so that no range exceeds
+    ``MAX_BATCH_CELLS``.  The header row is left untouched.
+    """
+
+    ordered = sorted(set(positions))
+    if not ordered:
+        return
+    end_column = _column_letter(len(headers))
+    rows_per_chunk = max(1, MAX_BATCH_CELLS // max(1, len(headers)))
+    data: List[Dict[str, Any]] = []
+    run: List[int] = []
+    for position in ordered + [-1]:
+        if run and position == run[-1] + 1 and len(run) < rows_per_chunk:
+            run.append(position)
+            continue
+        if run:
+            # Row 1 holds the headers, so data position 0 is sheet row 2.
+            data.append(
+                {
+                    "range": _a1_range(worksheet_title, f"A{run[0] + 2}:{end_column}{run[-1] + 2}"),
+                    "values": _format_rows_for_sheet(headers, [rows[index] for index in run]),
+                }
+            )
+        run = [position]
+
+    (
+        service.spreadsheets()
+        .values()
+        .batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"valueInputOption": "RAW", "data": data},
+        )
+        .execute()
+    )
+
+
 def get_rows(
     service=None,
     spreadsheet_id: str = SHEET_ID,
@@ -482,7 +546,10 @@ def upsert_rows(
     spreadsheet_id: str = SHEET_ID,
     worksheet_title: str = SHEET_NAME,
 ) -> None:
-    """Insert or update rows on the inventory sheet."""
+    """Insert or update rows on the inventory sheet.
+
+    Only new rows and rows whose values actually change are written back.
+    """
 
     if not rows:
         return
@@ -492,6 +559,7 @@ def upsert_rows(
     existing_values = _fetch_values(service, spreadsheet_id, headers, worksheet_title)
     current_rows = _rows_from_values(headers, existing_values)
     current_rows, index = _index_rows(current_rows)
+    touched: Set[int] = set()
 
     for incoming in rows:
         key_name, key_value = _key_for_row(incoming)
@@ -500,11 +568,13 @@ def upsert_rows(
         if position is not None:
             payload = current_rows[position]
         else:
-            payload = {header: None for header in headers}
+            payload = dict.fromkeys(headers)
             current_rows.append(payload)
             position = len(current_rows) - 1
-        for header, value in incoming.items():
-            payload[header] = value
+            touched.add(position)
+        if position not in touched and any(payload.get(key) != value for key, value in incoming.items()):
+            touched.add(position)
+        payload.update(incoming)
         index[(key_name, key_value)] = position
         for other_key in UPSERT_KEYS:
             other_value = incoming.get(other_key)
@@ -512,7 +582,14 @@ def upsert_rows(
                 continue
             index[(other_key, str(other_value))] = position
 
-    _write_sheet(service, spreadsheet_id, headers, current_rows, worksheet_title)
+    if not touched:
+        return
+    if isinstance(service, ExcelService):
+        # The workbook shim replaces the worksheet on every batchUpdate, so
+        # it still needs the full table.
+        _write_sheet(service, spreadsheet_id, headers, current_rows, worksheet_title)
+        return
+    _write_positions(service, spreadsheet_id, headers, current_rows, touched, worksheet_title)
 
 
 def delete_rows(
@@ -540,7 +617,14 @@ def delete_rows(
             continue
         filtered.append(row)
 
-    _write_sheet(service, spreadsheet_id, headers, filtered, worksheet_title)
+    _write_sheet(
+        service,
+        spreadsheet_id,
+        headers,
+        filtered,
+        worksheet_title,
+        blank_rows=len(current_rows) - len(filtered),
+    )
 
 
 __all__ = [
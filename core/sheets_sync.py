@@ -6,8 +6,9 @@ spreadsheet.  The implementation follows the requirements defined in the
 project specification and provides the following public entry points:
 
 ``push``
-    Push locally changed rows to Google Sheets in 300-500 sized batches,
-    performing automatic retry with exponential backoff.
+    Push locally changed rows to Google Sheets in batches sized by their
+    estimated request payload, performing automatic retry with exponential
+    backoff.
 
 ``pull``
     Fetch remote updates newer than the last local pull timestamp and
@@ -18,8 +19,8 @@ project specification and provides the following public entry points:
     generation.
 
 ``calc_hash``
-    Produce a stable SHA-256 hash for a Sheet row by serialising the row
-    JSON with deterministic ordering.
+    Produce a stable BLAKE2b-256 hash for a Sheet row by streaming its fields
+    into the digest in a fixed header order.
 
 In addition to the public API this module exposes a number of utilities
 that are used by the test-suite such as ``chunked`` and
@@ -28,15 +29,20 @@ that are used by the test-suite such as ``chunked`` and
 from __future__ import annotations
 
 import contextlib
+import functools
 import hashlib
 import json
 import logging
 import os
+import random
+import re
 import sqlite3
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
@@ -78,6 +84,13 @@ _OUTBOX = OutboxQueue()
 _DEBOUNCE_WINDOW = 3.0
 _DEBOUNCE_LOCK = threading.Lock()
 _DEBOUNCE_STATE: Dict[str, float] = {}
+# Sheet IDs of layouts already verified by _ensure_sheet_layout, keyed by
+# (spreadsheet_id, worksheet_title) with the monotonic time of the check.
+_LAYOUT_TTL = 3600.0
+_LAYOUT_LOCK = threading.Lock()
+_LAYOUT_CACHE: Dict[Tuple[str, str], Tuple[float, Dict[str, int]]] = {}
+# Per-thread Sheets clients keyed by credentials file; see get_client.
+_CLIENTS = threading.local()
 
 
 # ---------------------------------------------------------------------------
@@ -124,6 +137,25 @@ EXTRA_ITEM_HEADERS: Tuple[str, ...] = (
 
 HEADERS: List[str] = list(ITEM_HEADER_SEQUENCE) + list(EXTRA_ITEM_HEADERS)
 
+# Column position of every header inside SheetRow.values.
+_HEADER_INDEX: Dict[str, int] = {header: index for index, header in enumerate(HEADERS)}
+_HEADER_COUNT = len(HEADERS)
+_ROW_ID_COL = _HEADER_INDEX["RowID"]
+_HASH_COL = _HEADER_INDEX["Hash"]
+_UPDATED_AT_COL = _HEADER_INDEX["UpdatedAt"]
+_STATUS_COL = _HEADER_INDEX["Status"]
+_DELETED_COL = _HEADER_INDEX["Deleted"]
+_QTY_COL = _HEADER_INDEX["Qty"]
+
+# Per-row JSON overhead: quotes and separators for every cell plus the A1 range.
+_ROW_OVERHEAD_BYTES = 4 * len(HEADERS) + 64
+
+# Headers compared field-by-field during conflict resolution; bookkeeping
+# columns are handled separately.
+_MERGEABLE_HEADERS: Tuple[str, ...] = tuple(
+    header for header in HEADERS if header not in {"RowID", "Hash", "UpdatedAt"}
+)
+
 DEFAULT_WORKSHEET_TITLE = "items"
 META_SHEET_TITLE = "Settings"
 LOG_SHEET_TITLE = "Logs"
@@ -133,13 +165,25 @@ OFFLINE_QUEUE_MESSAGE = "Offline, change saved → will send when back online"
 STATUS_ALLOWED_VALUES: Tuple[str, ...] = ("active", "archived", "sold", "reserved")
 MAX_BATCH_ROWS = 500
 MIN_BATCH_ROWS = 300
+# Target request body size for push batches; well below the API limits.
+MAX_BATCH_BYTES = 2_000_000
 MAX_RETRY_ATTEMPTS = 5
-BACKOFF_SCHEDULE = (1, 2, 4, 8, 16)
+# Decorrelated-jitter backoff bounds, in seconds.
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 32.0
+# Longest server-requested wait honoured before giving up on the hint.
+RETRY_AFTER_CAP_SECONDS = 120.0
+RETRIABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Upper bound on Sheets requests in flight across all sync threads.
+MAX_CONCURRENT_REQUESTS = 4
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+# Worker threads used to send independent push batches.
+PUSH_WORKERS = MAX_CONCURRENT_REQUESTS
 
 LOCAL_STATE_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS sheet_sync_state (
     row_id TEXT PRIMARY KEY,
-    hash TEXT NOT NULL,
+    hash BLOB NOT NULL,
     updated_at TEXT NOT NULL
 )
 """
@@ -201,6 +245,7 @@ CUSTOMER_FIELD_MAP: Mapping[str, str] = {
     "Phone": "phone",
     "Email": "email",
 }
+_CUSTOMER_KEYS: Tuple[str, ...] = tuple(CUSTOMER_FIELD_MAP[header] for header in CUSTOMER_HEADERS)
 
 
 # ---------------------------------------------------------------------------
@@ -234,12 +279,33 @@ class SheetRow:
     """Representation of a row prepared for Google Sheets synchronisation."""
 
     row_id: str
-    values: Dict[str, str]
+    values: List[str]
     hash: str
     row_index: Optional[int] = None
+    # Raw form of ``hash`` when the row was hashed locally; saves a hex decode.
+    raw_hash: Optional[bytes] = None
 
     def as_list(self) -> List[str]:
-        return [self.values.get(header, "") for header in HEADERS]
+        """Return the cell values in ``HEADERS`` order (not a copy)."""
+
+        return self.values
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return the cell values keyed by header."""
+
+        return dict(zip(HEADERS, self.values))
+
+    def get(self, header: str, default: str = "") -> str:
+        index = _HEADER_INDEX.get(header)
+        return default if index is None else self.values[index]
+
+    @property
+    def digest(self) -> bytes:
+        """Return :attr:`hash` in the raw form kept in ``sheet_sync_state``."""
+
+        if self.raw_hash is not None:
+            return self.raw_hash
+        return _hash_to_blob(self.hash)
 
 
 def _debounce_row(row_id: str) -> bool:
@@ -271,22 +337,27 @@ def is_api_available() -> bool:
     return GOOGLE_API_AVAILABLE
 
 
+# Either the path segment after ``/spreadsheets/d/`` in a URL or, for bare
+# input, everything before a query string or fragment.
+_SPREADSHEET_ID_RE = re.compile(r"(?:.*?/spreadsheets/d/([^/?#]*)|([^?#]*))", re.DOTALL)
+_PATH_SEPARATOR_RE = re.compile(r"[/\\:]")
+# Already-normalised IDs, the common case, skip the URL parsing entirely.
+_BARE_ID_RE = re.compile(r"[A-Za-z0-9_-]{15,}")
+
+
 def parse_spreadsheet_id(value: str) -> str:
     """Normalise a spreadsheet identifier from raw input or URL."""
 
     if not value:
         return ""
+    if _BARE_ID_RE.fullmatch(value):
+        return value
 
-    value = value.strip()
-    if "/spreadsheets/d/" in value:
-        value = value.split("/spreadsheets/d/", 1)[1]
-        value = value.split("/", 1)[0]
-    if "?" in value:
-        value = value.split("?", 1)[0]
-    if "#" in value:
-        value = value.split("#", 1)[0]
+    match = _SPREADSHEET_ID_RE.match(value.strip())
+    url_id, bare_id = match.groups()
+    value = url_id if url_id is not None else bare_id
 
-    if any(sep in value for sep in ("/", "\\", ":")):
+    if _PATH_SEPARATOR_RE.search(value):
         raise SpreadsheetAccessError(
             "Spreadsheet ID appears to be a file path. Please provide a valid Google Sheets ID."
         )
@@ -331,13 +402,11 @@ def _format_credentials_error(exc: Exception) -> str:
     return message or "Invalid service account JSON file."
 
 
+_UTC_ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
 def _utcnow_iso() -> str:
-    return (
-        datetime.now(timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z")
-    )
+    return time.strftime(_UTC_ISO_FORMAT, time.gmtime())
 
 
 def require_worksheet_title(title: Optional[str]) -> str:
@@ -412,10 +481,26 @@ def resolve_credentials_path(raw_path: str) -> Path:
 
 
 def get_client(credentials_path: str, payload: Optional[Mapping[str, object]] = None):
-    """Return an authenticated Sheets API client using the service account."""
+    """Return an authenticated Sheets API client using the service account.
+
+    Clients built from a credentials file are reused by later calls on the
+    same thread, keeping the discovery document, the access token and the
+    keep-alive HTTPS connection.  The cache is per thread because an
+    httplib2 connection must not be shared between threads.  Passing
+    ``payload`` always builds a fresh client.
+    """
 
     _require_api()
     path = resolve_credentials_path(credentials_path)
+    cache: Optional[Dict[str, Tuple[int, Any]]] = None
+    if payload is None:
+        cache = getattr(_CLIENTS, "by_path", None)
+        if cache is None:
+            cache = _CLIENTS.by_path = {}
+        # The mtime makes a replaced key file produce a new client.
+        cached = cache.get(str(path))
+        if cached is not None and cached[0] == path.stat().st_mtime_ns:
+            return cached[1]
 
     try:
         data = payload or ensure_service_account_file(path)
@@ -437,9 +522,13 @@ def get_client(credentials_path: str, payload: Optional[Mapping[str, object]] =
         raise CredentialsFileInvalidError(_format_credentials_error(exc)) from exc
 
     try:
-        return build("sheets", "v4", credentials=credentials, cache_discovery=False)  # type: ignore[call-arg]
+        client = build("sheets", "v4", credentials=credentials, cache_discovery=False)  # type: ignore[call-arg]
     except Exception as exc:  # pragma: no cover - HTTP / auth error guard
         raise SpreadsheetAccessError(str(exc)) from exc
+    if cache is not None:
+        # Stat after ensure_service_account_file, which rewrites the file.
+        cache[str(path)] = (path.stat().st_mtime_ns, client)
+    return client
 
 
 def quote_worksheet_title(title: Optional[str]) -> str:
@@ -515,17 +604,11 @@ def _resolve_worksheet(
 def _read_header_row(service, spreadsheet_id: str, worksheet_title: str) -> List[str]:
     primary_range = _a1_range(worksheet_title, "1:1")
     try:
-        payload = _values_batch_get(service, spreadsheet_id, [primary_range])
+        [rows] = _batch_get_rows(service, spreadsheet_id, [primary_range])
     except HttpError:
         fallback_range = _a1_range(worksheet_title, "A1:Z1")
-        payload = _values_batch_get(service, spreadsheet_id, [fallback_range])
-    value_ranges = payload.get("valueRanges", [])
-    if not value_ranges:
-        return []
-    rows = value_ranges[0].get("values", [])
-    if not rows:
-        return []
-    return rows[0]
+        [rows] = _batch_get_rows(service, spreadsheet_id, [fallback_range])
+    return rows[0] if rows else []
 
 
 def _perform_write_check(
@@ -534,22 +617,27 @@ def _perform_write_check(
     worksheet_title: str,
     account_email: str,
 ) -> str:
+    """Write a marker to the test cell and restore it in one request.
+
+    ``values.batchUpdate`` applies its ranges in order and atomically, so the
+    marker write and the restore share one round trip and the cell is never
+    left holding the marker.  The write is confirmed by the cell count the
+    server reports for the marker range.
+    """
+
     test_range = _a1_range(worksheet_title, "Z1")
     marker = f"rb-health-{int(time.time() * 1000)}"
     original_value = ""
-    changed = False
 
     try:
-        existing = _values_batch_get(service, spreadsheet_id, [test_range])
-        values = existing.get("valueRanges", [{}])[0].get("values", [])
+        [values] = _batch_get_rows(service, spreadsheet_id, [test_range])
         if values and values[0]:
             original_value = str(values[0][0])
-        data = [{"range": test_range, "values": [[marker]]}]
-        _values_batch_update(service, spreadsheet_id, data)
-        changed = True
-        confirm = _values_batch_get(service, spreadsheet_id, [test_range])
-        confirm_values = confirm.get("valueRanges", [{}])[0].get("values", [])
-        confirmed = bool(confirm_values and confirm_values[0] and confirm_values[0][0] == marker)
+        data = [
+            {"range": test_range, "values": [[marker]]},
+            {"range": test_range, "values": [[original_value]]},
+        ]
+        response, _ = _values_batch_update(service, spreadsheet_id, data)
     except HttpError as exc:  # pragma: no cover - network interaction
         status = _http_status(exc)
         if status == 403:
@@ -557,40 +645,71 @@ def _perform_write_check(
                 f"Service account lacks edit permission (email: {account_email})."
             ) from exc
         raise SpreadsheetAccessError(f"Sheets write failed: {exc}") from exc
-    finally:
-        if changed:
-            restore_value = original_value if original_value is not None else ""
-            try:
-                _values_batch_update(
-                    service,
-                    spreadsheet_id,
-                    [{"range": test_range, "values": [[restore_value]]}],
-                )
-            except Exception:  # pragma: no cover - best effort
-                logger.debug("Failed to restore test cell after health check", exc_info=True)
-
-    if changed and confirmed:
+
+    responses = response.get("responses", []) if isinstance(response, dict) else []
+    if responses and _to_int(responses[0].get("updatedCells")) == 1:
         logger.info("Sheets write OK")
         return "ok"
-    if changed:
-        return "mismatch"
-    return "skipped"
+    return "mismatch"
+
+
+# Digest parameters are parsed once; calc_hash clones this empty state.
+_HASH_PROTOTYPE = hashlib.blake2b(digest_size=32)
+# ASCII unit/record separators never appear in typed cell values, so fields
+# cannot bleed into each other.
+_HASH_KEY_SEPARATOR = b"\x1f"
+_HASH_FIELD_SEPARATOR = b"\x1e"
+_HASH_ORDER: Tuple[Tuple[str, int, bytes], ...] = tuple(
+    (header, _HEADER_INDEX[header], header.encode("utf-8") + _HASH_KEY_SEPARATOR)
+    for header in sorted(HEADERS)
+    if header != "Hash"
+)
 
 
 def calc_hash(row: Mapping[str, Any]) -> str:
-    """Return a deterministic SHA-256 hash for the given Sheet row."""
+    """Return a deterministic BLAKE2b-256 hash for the given Sheet row."""
 
-    normalised: Dict[str, str] = {}
-    for key in HEADERS:
-        if key == "Hash":
-            continue
-        value = row.get(key, "") if isinstance(row, Mapping) else ""
-        if value is None:
-            normalised[key] = ""
-        else:
-            normalised[key] = str(value)
-    payload = json.dumps(normalised, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    if not isinstance(row, Mapping):
+        row = {}
+    get = row.get
+    hasher = _HASH_PROTOTYPE.copy()
+    update = hasher.update
+    for key, _, key_bytes in _HASH_ORDER:
+        value = get(key, "")
+        update(key_bytes)
+        if value is not None:
+            update(str(value).encode("utf-8"))
+        update(_HASH_FIELD_SEPARATOR)
+    return hasher.hexdigest()
+
+
+def _digest_values(values: Sequence[str]) -> bytes:
+    """Return the raw digest for a row already laid out in ``HEADERS`` order."""
+
+    hasher = _HASH_PROTOTYPE.copy()
+    update = hasher.update
+    for _, index, key_bytes in _HASH_ORDER:
+        update(key_bytes)
+        update(values[index].encode("utf-8"))
+        update(_HASH_FIELD_SEPARATOR)
+    return hasher.digest()
+
+
+def _hash_values(values: Sequence[str]) -> str:
+    """Return :func:`calc_hash` for a row already laid out in ``HEADERS`` order."""
+
+    return _digest_values(values).hex()
+
+
+def _hash_rows_bulk(rows: Sequence[Sequence[str]]) -> List[str]:
+    """Return the hash of every ``HEADERS``-ordered value list in ``rows``.
+
+    Used where a whole batch of rows needs hashing so callers can collect
+    the rows first and hash them in one tight loop.
+    """
+
+    hash_row = _hash_values
+    return [hash_row(values) for values in rows]
 
 
 def chunked(sequence: Sequence[Any], max_size: int = MAX_BATCH_ROWS) -> Iterator[Sequence[Any]]:
@@ -603,30 +722,82 @@ def chunked(sequence: Sequence[Any], max_size: int = MAX_BATCH_ROWS) -> Iterator
         yield sequence[start : start + max_size]
 
 
+def _estimated_row_bytes(row: SheetRow) -> int:
+    """Approximate the JSON payload size of ``row`` inside a batchUpdate body."""
+
+    return sum(map(len, row.values)) + _ROW_OVERHEAD_BYTES
+
+
+def _size_chunked(
+    items: Iterable[Any],
+    size_fn: Callable[[Any], int],
+    max_bytes: int = MAX_BATCH_BYTES,
+) -> Iterator[List[Any]]:
+    """Yield lists of ``items`` whose combined ``size_fn`` stays within ``max_bytes``.
+
+    An item larger than ``max_bytes`` on its own is still yielded as a
+    single-item batch.
+    """
+
+    if max_bytes <= 0:
+        raise ValueError("max_bytes must be positive")
+    batch: List[Any] = []
+    total = 0
+    for item in items:
+        size = size_fn(item)
+        if batch and total + size > max_bytes:
+            yield batch
+            batch = []
+            total = 0
+        batch.append(item)
+        total += size
+    if batch:
+        yield batch
+
+
 def detect_local_deltas(
     rows: Sequence[SheetRow],
-    previous_hashes: Mapping[str, str],
+    previous_hashes: Mapping[str, bytes],
 ) -> Tuple[List[SheetRow], List[SheetRow]]:
-    """Return ``(new_rows, changed_rows)`` using stored hash state."""
+    """Return ``(new_rows, changed_rows)`` using stored hash state.
+
+    Rows whose digest matches the stored one are skipped without further
+    work; local rows carry their raw digest so no hex decoding is needed.
+    """
 
     new_rows: List[SheetRow] = []
     changed_rows: List[SheetRow] = []
+    lookup = previous_hashes.get
+    add_new = new_rows.append
+    add_changed = changed_rows.append
     for row in rows:
-        known_hash = previous_hashes.get(row.row_id)
+        known_hash = lookup(row.row_id)
         if known_hash is None:
-            new_rows.append(row)
-        elif known_hash != row.hash:
-            changed_rows.append(row)
+            add_new(row)
+        elif known_hash != row.digest:
+            add_changed(row)
     return new_rows, changed_rows
 
 
 # ---------------------------------------------------------------------------
 # SQLite helpers
 # ---------------------------------------------------------------------------
+# Per-connection tuning for the bulk reads and writes done during a sync.
+# WAL is deliberately not enabled: drive_sync uploads, hashes and replaces
+# the database file directly, which is only safe with a rollback journal.
+_SYNC_CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+)
+
+
 def _connect(db_path: Optional[str] = None) -> sqlite3.Connection:
     path = db_path or db.DB_PATH
     connection = sqlite3.connect(path)
     connection.row_factory = sqlite3.Row
+    for pragma in _SYNC_CONNECTION_PRAGMAS:
+        connection.execute(pragma)
     with connection:
         connection.execute(LOCAL_STATE_TABLE_SQL)
         connection.execute(LOCAL_META_TABLE_SQL)
@@ -638,103 +809,263 @@ def _read_local_meta(conn: sqlite3.Connection) -> Dict[str, str]:
     return {row["key"]: row["value"] for row in cursor.fetchall()}
 
 
-def _write_local_meta(conn: sqlite3.Connection, updates: Mapping[str, str]) -> None:
-    timestamp = _utcnow_iso()
-    with conn:
-        conn.executemany(
-            "INSERT INTO sheet_sync_meta(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-            [(key, value) for key, value in updates.items()],
-        )
-        conn.execute(
-            "INSERT INTO sheet_sync_meta(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-            ("last_state_update", timestamp),
-        )
+def _write_local_meta(
+    conn: sqlite3.Connection,
+    updates: Mapping[str, str],
+    timestamp: str,
+) -> None:
+    """Upsert ``updates`` into the meta table; the caller owns the transaction."""
+
+    conn.executemany(
+        "INSERT INTO sheet_sync_meta(key, value) VALUES(?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+        [*updates.items(), ("last_state_update", timestamp)],
+    )
 
 
-def _load_previous_hashes(conn: sqlite3.Connection) -> Dict[str, str]:
+def _hash_to_blob(value: str) -> bytes:
+    """Return the raw digest bytes for a hex ``value``.
+
+    Hand-edited or legacy values that are not valid hex are kept as their
+    UTF-8 bytes so they still compare unequal to any real digest.
+    """
+
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        return value.encode("utf-8")
+
+
+def _load_previous_hashes(conn: sqlite3.Connection) -> Dict[str, bytes]:
+    """Return the stored digest per row ID as raw bytes.
+
+    Databases written before digests were stored as BLOBs still hold hex
+    text; those values are converted on read and rewritten on the next sync.
+    """
+
     cursor = conn.execute("SELECT row_id, hash FROM sheet_sync_state")
-    return {row["row_id"]: row["hash"] for row in cursor.fetchall()}
+    return {
+        row_id: digest if isinstance(digest, bytes) else _hash_to_blob(digest)
+        for row_id, digest in cursor.fetchall()
+    }
 
 
-def _update_local_hash_state(conn: sqlite3.Connection, rows: Sequence[SheetRow]) -> None:
-    timestamp = _utcnow_iso()
-    payload = [
-        (row.row_id, row.hash, timestamp)
-        for row in rows
-    ]
+def _update_local_hash_state(
+    conn: sqlite3.Connection,
+    rows: Sequence[SheetRow],
+    timestamp: str,
+) -> None:
+    """Record the synced hash of ``rows``; the caller owns the transaction."""
+
+    conn.executemany(
+        "INSERT INTO sheet_sync_state(row_id, hash, updated_at) VALUES(?, ?, ?) "
+        "ON CONFLICT(row_id) DO UPDATE SET hash=excluded.hash, updated_at=excluded.updated_at",
+        [(row.row_id, row.digest, timestamp) for row in rows],
+    )
+
+
+def _persist_sync_state(
+    conn: sqlite3.Connection,
+    rows: Sequence[SheetRow],
+    meta_updates: Mapping[str, str],
+    timestamp: Optional[str] = None,
+    *,
+    item_payloads: Sequence[Mapping[str, Any]] = (),
+) -> None:
+    """Store row hashes and meta updates in a single write transaction.
+
+    ``timestamp`` is the sync's own timestamp; the current time is used when
+    it is omitted.  ``item_payloads`` are upserted into the item table in the
+    same transaction, so a pull commits once.
+    """
+
+    timestamp = timestamp or _utcnow_iso()
     with conn:
-        conn.executemany(
-            "INSERT INTO sheet_sync_state(row_id, hash, updated_at) VALUES(?, ?, ?) "
-            "ON CONFLICT(row_id) DO UPDATE SET hash=excluded.hash, updated_at=excluded.updated_at",
-            payload,
+        conn.execute("BEGIN IMMEDIATE")
+        db.upsert_items_many(item_payloads, conn=conn)
+        _update_local_hash_state(conn, rows, timestamp)
+        _write_local_meta(conn, meta_updates, timestamp)
+
+
+_LOCAL_ITEM_COLUMNS: Tuple[str, ...] = (
+    "item_id", "rug_no", "upc", "roll_no", "v_rug_no", "v_collection", "collection",
+    "v_design", "design", "brand_name", "ground", "border", "a_size", "st_size", "area", "type",
+    "rate", "amount", "shape", "style", "image_file_name", "origin", "retail", "sp", "msrp", "cost",
+    "qty", "created_at", "updated_at", "version", "status", "location", "consignment_id",
+    "sold_at", "customer_id", "sale_price", "sale_note",
+)
+_LOCAL_ITEM_SELECT = f"SELECT {', '.join(_LOCAL_ITEM_COLUMNS)} FROM item"
+# Column positions within _LOCAL_ITEM_SELECT so rows can be read as plain tuples.
+_LOCAL_COLUMN_INDEX: Dict[str, int] = {name: index for index, name in enumerate(_LOCAL_ITEM_COLUMNS)}
+# ``(sheet column, SELECT position)`` for every sheet column copied from the
+# item table; derived columns such as Hash and Deleted are left out.
+_ACTIVE_MAPPINGS: Tuple[Tuple[int, int], ...] = tuple(
+    (_HEADER_INDEX[header], _LOCAL_COLUMN_INDEX[source])
+    for header, source in LOCAL_TO_SHEET_FIELD_MAP.items()
+    if source
+)
+_ITEM_ID_POS = _LOCAL_COLUMN_INDEX["item_id"]
+_STATUS_POS = _LOCAL_COLUMN_INDEX["status"]
+_QTY_POS = _LOCAL_COLUMN_INDEX["qty"]
+_DELETED_STATUSES = frozenset({"archived", "deleted"})
+_FETCH_BATCH_SIZE = 5000
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+_SQL_IN_CHUNK = 500
+
+
+def _sqlite_row_to_sheet(row: Sequence[Any], now_iso: Optional[str] = None) -> SheetRow:
+    """Convert a ``_LOCAL_ITEM_SELECT`` row (tuple or :class:`sqlite3.Row`).
+
+    ``now_iso`` stands in for a missing ``updated_at``; bulk callers pass one
+    timestamp for the whole batch.
+    """
+
+    values: List[str] = [""] * _HEADER_COUNT
+    for header_index, position in _ACTIVE_MAPPINGS:
+        value = row[position]
+        if value is not None:
+            values[header_index] = str(value)
+    status = (row[_STATUS_POS] or "").strip()
+    values[_STATUS_COL] = status or "active"
+    values[_DELETED_COL] = "TRUE" if status in _DELETED_STATUSES else ""
+    if not values[_UPDATED_AT_COL]:
+        values[_UPDATED_AT_COL] = now_iso or _utcnow_iso()
+    qty_value = row[_QTY_POS]
+    values[_QTY_COL] = str(qty_value if qty_value is not None else 0)
+    values[_ROW_ID_COL] = row_id = str(row[_ITEM_ID_POS])
+    raw_hash = _digest_values(values)
+    values[_HASH_COL] = digest = raw_hash.hex()
+    return SheetRow(row_id=row_id, values=values, hash=digest, raw_hash=raw_hash)
+
+
+def _fetch_local_rows(conn: sqlite3.Connection, now_iso: Optional[str] = None) -> List[SheetRow]:
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.arraysize = _FETCH_BATCH_SIZE
+    cursor.execute(_LOCAL_ITEM_SELECT)
+    now_iso = now_iso or _utcnow_iso()
+    convert = _sqlite_row_to_sheet
+    rows: List[SheetRow] = []
+    while batch := cursor.fetchmany():
+        rows.extend([convert(record, now_iso) for record in batch])
+    return rows
+
+
+def _fetch_local_rows_by_id(
+    conn: sqlite3.Connection,
+    row_ids: Sequence[str],
+) -> Dict[str, sqlite3.Row]:
+    """Return the raw ``item`` rows for ``row_ids`` using chunked IN queries."""
+
+    found: Dict[str, sqlite3.Row] = {}
+    for chunk in chunked(row_ids, _SQL_IN_CHUNK):
+        placeholders = ",".join("?" * len(chunk))
+        cursor = conn.execute(
+            f"{_LOCAL_ITEM_SELECT} WHERE item_id IN ({placeholders})",
+            tuple(chunk),
         )
+        for row in cursor.fetchall():
+            found[str(row["item_id"])] = row
+    return found
 
 
-def _sqlite_row_to_sheet(row: sqlite3.Row) -> SheetRow:
-    record = dict(row)
-    values: Dict[str, str] = {header: "" for header in HEADERS}
-    for header, source in LOCAL_TO_SHEET_FIELD_MAP.items():
-        if source:
-            raw_value = record.get(source)
-            values[header] = "" if raw_value is None else str(raw_value)
-        else:
-            values[header] = ""
-    status = (record.get("status") or "").strip()
-    values["Status"] = status or "active"
-    values["Deleted"] = "TRUE" if status in {"archived", "deleted"} else ""
-    values["UpdatedAt"] = values.get("UpdatedAt") or record.get("updated_at") or ""
-    if not values["UpdatedAt"]:
-        values["UpdatedAt"] = _utcnow_iso()
-    qty_value = record.get("qty")
-    values["Qty"] = str(qty_value if qty_value is not None else 0)
-    consignment = record.get("consignment_id")
-    values["Consignment"] = "" if consignment is None else str(consignment)
-    values["RowID"] = str(record.get("item_id"))
-    values["Hash"] = calc_hash(values)
-    return SheetRow(row_id=values["RowID"], values=values, hash=values["Hash"])
-
-
-def _fetch_local_rows(conn: sqlite3.Connection) -> List[SheetRow]:
-    cursor = conn.execute(
-        "SELECT item_id, rug_no, upc, roll_no, v_rug_no, v_collection, collection, "
-        "v_design, design, brand_name, ground, border, a_size, st_size, area, type, "
-        "rate, amount, shape, style, image_file_name, origin, retail, sp, msrp, cost, "
-        "qty, created_at, updated_at, version, status, location, consignment_id, "
-        "sold_at, customer_id, sale_price, sale_note "
-        "FROM item"
-    )
-    return [_sqlite_row_to_sheet(row) for row in cursor.fetchall()]
+def _load_push_state(
+    db_path: Optional[str],
+    now_iso: Optional[str] = None,
+) -> Tuple[Dict[str, bytes], List[SheetRow]]:
+    """Return ``(previous_hashes, local_rows)`` using a dedicated connection.
+
+    Runs on a worker thread while the remote sheet is being read, so it must
+    not share a connection with the caller.
+    """
+
+    with contextlib.closing(_connect(db_path)) as conn:
+        return _load_previous_hashes(conn), _fetch_local_rows(conn, now_iso)
+
+
+def _load_pull_state(db_path: Optional[str]) -> Tuple[Dict[str, str], Dict[str, bytes]]:
+    """Return ``(meta, previous_hashes)`` using a dedicated connection."""
+
+    with contextlib.closing(_connect(db_path)) as conn:
+        return _read_local_meta(conn), _load_previous_hashes(conn)
 
 
 # ---------------------------------------------------------------------------
 # Google Sheets helpers
 # ---------------------------------------------------------------------------
+def _retry_after_seconds(exc: HttpError) -> Optional[float]:
+    """Return the server-requested wait from ``Retry-After``/``X-RateLimit-Reset``."""
+
+    resp = getattr(exc, "resp", None)
+    getter = getattr(resp, "get", None)
+    if getter is None:
+        return None
+    retry_after = getter("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(str(retry_after))
+            except (TypeError, ValueError):
+                when = None
+            if when is not None:
+                if when.tzinfo is None:
+                    when = when.replace(tzinfo=timezone.utc)
+                return max(0.0, when.timestamp() - time.time())
+    reset = getter("x-ratelimit-reset")
+    if reset:
+        try:
+            value = float(reset)
+        except ValueError:
+            return None
+        # Either an epoch timestamp or a relative number of seconds.
+        if value > 1_000_000_000:
+            value -= time.time()
+        return max(0.0, value)
+    return None
+
+
+def _next_backoff(previous: float) -> float:
+    """Return the next decorrelated-jitter delay after ``previous`` seconds."""
+
+    upper = max(BACKOFF_BASE_SECONDS, previous * 3)
+    return min(BACKOFF_CAP_SECONDS, random.uniform(BACKOFF_BASE_SECONDS, upper))
+
+
 def _call_with_retry(func: Callable[[], Any], description: str) -> Tuple[Any, int]:
-    """Execute ``func`` applying exponential backoff for retriable errors."""
+    """Execute ``func`` retrying transient errors with jittered backoff.
+
+    A ``Retry-After`` hint from the API takes precedence over the computed
+    delay.  At most ``MAX_CONCURRENT_REQUESTS`` calls run at once; waiting
+    happens outside that limit so a backing-off thread does not hold a slot.
+    """
 
     attempt = 0
+    delay = BACKOFF_BASE_SECONDS
     while True:
         try:
-            result = func()
-        except HttpError as exc:  # pragma: no cover - network interaction
-            status = getattr(exc, "status_code", None) or getattr(getattr(exc, "resp", None), "status", None)
-            if status not in {429, 500, 502, 503, 504}:
+            with _REQUEST_SLOTS:
+                result = func()
+        except HttpError as exc:
+            status = _http_status(exc)
+            if status not in RETRIABLE_STATUS_CODES:
                 raise
             if attempt >= MAX_RETRY_ATTEMPTS - 1:
                 raise
-            delay = BACKOFF_SCHEDULE[min(attempt, len(BACKOFF_SCHEDULE) - 1)]
+            hinted = _retry_after_seconds(exc)
+            delay = _next_backoff(delay)
+            wait = min(RETRY_AFTER_CAP_SECONDS, hinted) if hinted is not None else delay
             attempt += 1
             logger.warning(
-                "Sheets API %s error (%s). Retrying in %ss (%d/%d)",
+                "Sheets API %s error (%s). Retrying in %.1fs (%d/%d)",
                 description,
                 status,
-                delay,
+                wait,
                 attempt,
                 MAX_RETRY_ATTEMPTS,
             )
-            time.sleep(delay)
+            time.sleep(wait)
             continue
         else:
             return result, attempt
@@ -750,6 +1081,20 @@ def _values_batch_get(service, spreadsheet_id: str, ranges: Sequence[str]) -> Di
     return result
 
 
+def _batch_get_rows(service, spreadsheet_id: str, ranges: Sequence[str]) -> List[List[List[str]]]:
+    """Return the ``values`` grid for each of ``ranges``, in request order.
+
+    Ranges the API reports as empty come back as empty lists, so callers can
+    index the result directly instead of walking ``valueRanges`` themselves.
+    """
+
+    value_ranges = _values_batch_get(service, spreadsheet_id, ranges).get("valueRanges") or ()
+    grids: List[List[List[str]]] = [entry.get("values") or [] for entry in value_ranges]
+    if len(grids) < len(ranges):
+        grids.extend([] for _ in range(len(ranges) - len(grids)))
+    return grids
+
+
 def _values_batch_update(service, spreadsheet_id: str, data: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], int]:
     request = service.spreadsheets().values().batchUpdate(
         spreadsheetId=spreadsheet_id,
@@ -758,25 +1103,23 @@ def _values_batch_update(service, spreadsheet_id: str, data: List[Dict[str, Any]
     return _call_with_retry(request.execute, "values.batchUpdate")
 
 
-def _values_clear(service, spreadsheet_id: str, range_spec: str) -> None:
-    request = service.spreadsheets().values().clear(
-        spreadsheetId=spreadsheet_id,
-        range=range_spec,
-        body={},
-    )
-    _call_with_retry(request.execute, "values.clear")
+# Field mask for reads that only need each sheet's title, ID and grid size.
+_SHEET_PROPERTIES_FIELDS = "sheets.properties(title,sheetId,gridProperties(rowCount,columnCount))"
 
 
-def _spreadsheet_get(service, spreadsheet_id: str) -> Dict[str, Any]:
-    request = service.spreadsheets().get(spreadsheetId=spreadsheet_id, includeGridData=False)
+def _spreadsheet_get(service, spreadsheet_id: str, *, fields: Optional[str] = None) -> Dict[str, Any]:
+    options: Dict[str, Any] = {"spreadsheetId": spreadsheet_id, "includeGridData": False}
+    if fields:
+        options["fields"] = fields
+    request = service.spreadsheets().get(**options)
     result, _ = _call_with_retry(request.execute, "spreadsheets.get")
     return result
 
 
 def _column_to_index(header: str) -> int:
     try:
-        return HEADERS.index(header)
-    except ValueError:
+        return _HEADER_INDEX[header]
+    except KeyError:
         raise SheetsSyncError(f"Unknown header: {header}")
 
 
@@ -791,14 +1134,23 @@ def _column_a1(column_index: int) -> str:
 
 INVENTORY_LAST_COLUMN = _column_a1(len(HEADERS) - 1)
 FULL_COLUMN_RANGE = f"A:{INVENTORY_LAST_COLUMN}"
+ROW_ID_COLUMN = _column_a1(_ROW_ID_COL)
+UPDATED_AT_COLUMN = _column_a1(_UPDATED_AT_COL)
+# UpdatedAt, RowID and Hash sit side by side, so pull reads the three sync
+# markers as one narrow block.
+_MARKER_FIRST_COL = min(_UPDATED_AT_COL, _ROW_ID_COL, _HASH_COL)
+_MARKER_LAST_COL = max(_UPDATED_AT_COL, _ROW_ID_COL, _HASH_COL)
+MARKER_RANGE = f"{_column_a1(_MARKER_FIRST_COL)}2:{_column_a1(_MARKER_LAST_COL)}"
+# More changed runs than this and pull reads the whole table instead.
+MAX_PROJECTED_RANGES = 100
+CUSTOMER_LAST_COLUMN = _column_a1(len(CUSTOMER_HEADERS) - 1)
+HEADER_ROW_RANGE = f"A1:{INVENTORY_LAST_COLUMN}1"
 
 
 def _sheet_range(row_index: int) -> str:
     if row_index < 1:
         raise SheetsSyncError(f"Row index must be >= 1 for A1 ranges (received: {row_index})")
-    start = _column_a1(0)
-    end = INVENTORY_LAST_COLUMN
-    return f"{start}{row_index}:{end}{row_index}"
+    return f"A{row_index}:{INVENTORY_LAST_COLUMN}{row_index}"
 
 
 def inventory_full_range(worksheet_title: Optional[str]) -> str:
@@ -813,6 +1165,53 @@ def inventory_row_range(worksheet_title: Optional[str], row_index: int) -> str:
     return _a1_range(worksheet_title, _sheet_range(row_index))
 
 
+def inventory_rows_range(worksheet_title: Optional[str], first_row: int, last_row: int) -> str:
+    """Return an A1 range spanning inventory rows ``first_row`` to ``last_row``."""
+
+    if first_row < 1 or last_row < first_row:
+        raise SheetsSyncError(f"Invalid row span for A1 range: {first_row}-{last_row}")
+    return _a1_range(worksheet_title, f"A{first_row}:{INVENTORY_LAST_COLUMN}{last_row}")
+
+
+def _coalesce_row_updates(
+    worksheet_title: str,
+    updates: Sequence[Tuple[int, SheetRow]],
+) -> List[Dict[str, Any]]:
+    """Return batchUpdate ``data`` with one range per run of consecutive rows.
+
+    ``updates`` must be sorted by row index; a repeated index starts a new
+    run so the later value still wins.
+    """
+
+    data: List[Dict[str, Any]] = []
+    if not updates:
+        return data
+    if updates[0][0] < 1:
+        raise SheetsSyncError(f"Row index must be >= 1 for A1 ranges (received: {updates[0][0]})")
+    # Quote the title once; every run shares the same prefix and last column.
+    prefix = f"{quote_worksheet_title(worksheet_title)}!A"
+    last_column = INVENTORY_LAST_COLUMN
+    run_start = run_end = 0
+    run_values: List[List[str]] = []
+    for row_index, row in updates:
+        if run_values and row_index == run_end + 1:
+            run_values.append(row.values)
+            run_end = row_index
+            continue
+        if run_values:
+            data.append({"range": f"{prefix}{run_start}:{last_column}{run_end}", "values": run_values})
+        run_start = run_end = row_index
+        run_values = [row.values]
+    data.append({"range": f"{prefix}{run_start}:{last_column}{run_end}", "values": run_values})
+    return data
+
+
+def inventory_row_id_range(worksheet_title: Optional[str]) -> str:
+    """Return an A1 range covering the RowID column below the header row."""
+
+    return _a1_range(worksheet_title, f"{ROW_ID_COLUMN}2:{ROW_ID_COLUMN}")
+
+
 def inventory_column_range(worksheet_title: Optional[str]) -> str:
     """Return an A1 range spanning all inventory columns."""
 
@@ -823,30 +1222,88 @@ def _ensure_sheet_structure(
     service,
     spreadsheet_id: str,
     worksheet_title: str,
+    *,
+    use_cache: bool = True,
 ) -> int:
     """Ensure worksheet, meta, and log sheets exist and return worksheet ID."""
 
-    metadata = _spreadsheet_get(service, spreadsheet_id)
-    sheets = metadata.get("sheets", []) if isinstance(metadata, dict) else []
-    worksheet_id: Optional[int] = None
-    meta_id: Optional[int] = None
-    log_id: Optional[int] = None
-    customer_sheet_id: Optional[int] = None
+    return _ensure_sheet_layout(service, spreadsheet_id, worksheet_title, use_cache=use_cache)[worksheet_title]
+
+
+def _forget_sheet_layouts() -> None:
+    """Drop every cached layout so the next sync verifies the sheet again."""
+
+    with _LAYOUT_LOCK:
+        _LAYOUT_CACHE.clear()
+
+
+def _forget_layouts_on_error(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Clear the layout cache when ``func`` fails, e.g. after a sheet was
+    renamed or deleted behind our back."""
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except (SpreadsheetAccessError, HttpError):
+            _forget_sheet_layouts()
+            raise
+
+    return wrapper
+
 
+def _ensure_sheet_layout(
+    service,
+    spreadsheet_id: str,
+    worksheet_title: str,
+    *,
+    use_cache: bool = True,
+) -> Dict[str, int]:
+    """Ensure worksheet, meta, and log sheets exist and return IDs by title.
+
+    A layout verified less than :data:`_LAYOUT_TTL` seconds ago is returned
+    from the cache without any API call unless ``use_cache`` is false.
+    """
+
+    key = (spreadsheet_id, worksheet_title)
+    if use_cache:
+        with _LAYOUT_LOCK:
+            cached = _LAYOUT_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _LAYOUT_TTL:
+            return dict(cached[1])
+
+    sheet_ids = _verify_sheet_layout(service, spreadsheet_id, worksheet_title)
+    with _LAYOUT_LOCK:
+        _LAYOUT_CACHE[key] = (time.monotonic(), sheet_ids)
+    return dict(sheet_ids)
+
+
+def _verify_sheet_layout(
+    service,
+    spreadsheet_id: str,
+    worksheet_title: str,
+) -> Dict[str, int]:
+    """Create missing sheets and headers and return sheet IDs by title.
+
+    Missing sheets are added in one ``batchUpdate`` whose replies carry the
+    new sheet IDs.  Header rows of pre-existing sheets are checked with one
+    ``batchGet``; missing or stale headers are written by the same
+    ``batchUpdate`` that applies the formatting.
+    """
+
+    metadata = _spreadsheet_get(service, spreadsheet_id, fields=_SHEET_PROPERTIES_FIELDS)
+    sheets = metadata.get("sheets", []) if isinstance(metadata, dict) else []
+    sheet_ids: Dict[str, Optional[int]] = {}
+    grid_sizes: Dict[str, Tuple[int, int]] = {}
     for sheet in sheets:
         properties = sheet.get("properties", {})
-        if properties.get("title") == worksheet_title:
-            worksheet_id = properties.get("sheetId")
-        if properties.get("title") == META_SHEET_TITLE:
-            meta_id = properties.get("sheetId")
-        if properties.get("title") == LOG_SHEET_TITLE:
-            log_id = properties.get("sheetId")
-        if properties.get("title") == CUSTOMER_SHEET_TITLE:
-            customer_sheet_id = properties.get("sheetId")
+        sheet_ids[properties.get("title")] = properties.get("sheetId")
+        grid_sizes[properties.get("title")] = _grid_size(properties)
 
     requests: List[Dict[str, Any]] = []
+    added: set[str] = set()
 
-    if worksheet_id is None:
+    if worksheet_title not in sheet_ids:
         requests.append(
             {
                 "addSheet": {
@@ -857,7 +1314,7 @@ def _ensure_sheet_structure(
                 }
             }
         )
-    if meta_id is None:
+    if META_SHEET_TITLE not in sheet_ids:
         requests.append(
             {
                 "addSheet": {
@@ -869,7 +1326,7 @@ def _ensure_sheet_structure(
                 }
             }
         )
-    if log_id is None:
+    if LOG_SHEET_TITLE not in sheet_ids:
         requests.append(
             {
                 "addSheet": {
@@ -880,7 +1337,7 @@ def _ensure_sheet_structure(
                 }
             }
         )
-    if customer_sheet_id is None:
+    if CUSTOMER_SHEET_TITLE not in sheet_ids:
         requests.append(
             {
                 "addSheet": {
@@ -900,59 +1357,69 @@ def _ensure_sheet_structure(
             spreadsheetId=spreadsheet_id,
             body={"requests": requests},
         )
-        _call_with_retry(request.execute, "spreadsheets.batchUpdate")
-        metadata = _spreadsheet_get(service, spreadsheet_id)
-        sheets = metadata.get("sheets", [])
-        for sheet in sheets:
-            properties = sheet.get("properties", {})
-            if properties.get("title") == worksheet_title:
-                worksheet_id = properties.get("sheetId")
-            if properties.get("title") == META_SHEET_TITLE:
-                meta_id = properties.get("sheetId")
-            if properties.get("title") == LOG_SHEET_TITLE:
-                log_id = properties.get("sheetId")
-            if properties.get("title") == CUSTOMER_SHEET_TITLE:
-                customer_sheet_id = properties.get("sheetId")
-
+        response, _ = _call_with_retry(request.execute, "spreadsheets.batchUpdate")
+        replies = response.get("replies", []) if isinstance(response, dict) else []
+        for reply in replies:
+            properties = reply.get("addSheet", {}).get("properties", {})
+            if properties.get("title") is not None:
+                sheet_ids[properties["title"]] = properties.get("sheetId")
+                grid_sizes[properties["title"]] = _grid_size(properties)
+                added.add(properties["title"])
+
+    worksheet_id = sheet_ids.get(worksheet_title)
     if worksheet_id is None:
         raise SpreadsheetAccessError("Worksheet could not be found or created.")
 
-    # Ensure headers present
-    header_range = _a1_range(worksheet_title, f"A1:{_column_a1(len(HEADERS) - 1)}1")
-    current_headers = _values_batch_get(service, spreadsheet_id, [header_range])
-    values = current_headers.get("valueRanges", [{}])[0].get("values", [])
-    if not values or values[0] != HEADERS:
-        _values_batch_update(
-            service,
-            spreadsheet_id,
-            [
-                {
-                    "range": header_range,
-                    "values": [HEADERS],
-                }
-            ],
-        )
-
-    customer_header_range = _a1_range(
-        CUSTOMER_SHEET_TITLE, f"A1:{_column_a1(len(CUSTOMER_HEADERS) - 1)}1"
+    # Header rows: (sheet, range, expected values, replace when they differ
+    # rather than only when the row is empty).  Sheets added above are
+    # known to be blank, so only the others are read.
+    header_checks = (
+        (worksheet_title, HEADER_ROW_RANGE, list(HEADERS), True),
+        (CUSTOMER_SHEET_TITLE, f"A1:{CUSTOMER_LAST_COLUMN}1", list(CUSTOMER_HEADERS), True),
+        (META_SHEET_TITLE, "A1:B1", ["Key", "Value"], False),
+        (LOG_SHEET_TITLE, "A1:B1", ["Timestamp", "Action"], False),
     )
-    current_customer_headers = _values_batch_get(
-        service,
-        spreadsheet_id,
-        [customer_header_range],
-    )
-    customer_values = current_customer_headers.get("valueRanges", [{}])[0].get("values", [])
-    if not customer_values or customer_values[0] != list(CUSTOMER_HEADERS):
-        _values_batch_update(
+    existing_checks = [check for check in header_checks if check[0] not in added]
+    current_headers = (
+        _batch_get_rows(
             service,
             spreadsheet_id,
-            [
-                {
-                    "range": customer_header_range,
-                    "values": [list(CUSTOMER_HEADERS)],
-                }
-            ],
+            [_a1_range(title, range_spec) for title, range_spec, _, _ in existing_checks],
         )
+        if existing_checks
+        else []
+    )
+    stale = added | {
+        title
+        for (title, _, expected, strict), values in zip(existing_checks, current_headers)
+        if not values or (strict and values[0] != expected)
+    }
+    header_requests = [
+        {
+            "updateCells": {
+                "start": {"sheetId": sheet_ids[title], "rowIndex": 0, "columnIndex": 0},
+                "rows": [_string_row(expected)],
+                "fields": "userEnteredValue",
+            }
+        }
+        for title, _, expected, _ in header_checks
+        if title in stale and sheet_ids.get(title) is not None
+    ]
+    # updateCells, setBasicFilter and repeatCell never widen a grid, so a
+    # pre-existing sheet narrower than its headers is widened first.
+    widen_requests = [
+        {
+            "appendDimension": {
+                "sheetId": sheet_ids[title],
+                "dimension": "COLUMNS",
+                "length": len(expected) - grid_sizes[title][1],
+            }
+        }
+        for title, _, expected, _ in existing_checks
+        if sheet_ids.get(title) is not None
+        and title in grid_sizes
+        and 0 < grid_sizes[title][1] < len(expected)
+    ]
 
     # Apply formatting (freeze header, filters, validation, currency)
     status_index = _column_to_index("Status")
@@ -961,7 +1428,7 @@ def _ensure_sheet_structure(
         for column in ("Retail", "SP", "MSRP", "Cost", "Rate", "Amount")
         if column in HEADERS
     ]
-    format_requests = [
+    format_requests = widen_requests + header_requests + [
         {
             "updateSheetProperties": {
                 "properties": {
@@ -1030,39 +1497,29 @@ def _ensure_sheet_structure(
     )
     _call_with_retry(request.execute, "spreadsheets.batchUpdate")
 
-    # Ensure meta sheet headers exist
-    meta_header_range = _a1_range(META_SHEET_TITLE, "A1:B1")
-    meta_current = _values_batch_get(service, spreadsheet_id, [meta_header_range])
-    meta_values = meta_current.get("valueRanges", [{}])[0].get("values", [])
-    if not meta_values:
-        _values_batch_update(
-            service,
-            spreadsheet_id,
-            [
-                {
-                    "range": meta_header_range,
-                    "values": [["Key", "Value"]],
-                }
-            ],
-        )
+    return {title: sheet_id for title, sheet_id in sheet_ids.items() if sheet_id is not None}
 
-    # Ensure log sheet headers exist
-    log_header_range = _a1_range(LOG_SHEET_TITLE, "A1:B1")
-    log_current = _values_batch_get(service, spreadsheet_id, [log_header_range])
-    log_values = log_current.get("valueRanges", [{}])[0].get("values", [])
-    if not log_values:
-        _values_batch_update(
-            service,
-            spreadsheet_id,
-            [
-                {
-                    "range": log_header_range,
-                    "values": [["Timestamp", "Action"]],
-                }
-            ],
-        )
 
-    return worksheet_id
+def _grid_size(properties: Mapping[str, Any]) -> Tuple[int, int]:
+    """Return ``(rowCount, columnCount)`` from sheet properties, 0 when unknown."""
+
+    grid = properties.get("gridProperties") or {}
+    return _to_int(grid.get("rowCount")), _to_int(grid.get("columnCount"))
+
+
+def _grid_row_count(service, spreadsheet_id: str, sheet_id: int) -> int:
+    """Return the current row count of ``sheet_id``.
+
+    Always read from the API: other RugBase clients grow and shrink the same
+    sheets, so a count remembered from an earlier sync cannot be trusted.
+    """
+
+    metadata = _spreadsheet_get(service, spreadsheet_id, fields=_SHEET_PROPERTIES_FIELDS)
+    for sheet in metadata.get("sheets", []) if isinstance(metadata, dict) else []:
+        properties = sheet.get("properties", {})
+        if properties.get("sheetId") == sheet_id:
+            return _grid_size(properties)[0]
+    raise SpreadsheetAccessError(f"Sheet {sheet_id} could not be found.")
 
 
 def ensure_sheet(service, spreadsheet_id: str, worksheet_title: str) -> int:
@@ -1084,110 +1541,306 @@ def ensure_sheet(service, spreadsheet_id: str, worksheet_title: str) -> int:
 def _sync_customers_sheet(
     service,
     spreadsheet_id: str,
+    sheet_id: int,
     customers: Sequence[Mapping[str, Any]],
     *,
     log_callback: Optional[Callable[[str], None]] = None,
 ) -> int:
-    clear_range = _a1_range(
-        CUSTOMER_SHEET_TITLE, f"A2:{_column_a1(len(CUSTOMER_HEADERS) - 1)}"
-    )
-    _values_clear(service, spreadsheet_id, clear_range)
+    """Replace the customer rows below the header in one ``batchUpdate``.
 
-    if not customers:
-        if log_callback:
-            log_callback("Customers sheet cleared (0 rows).")
-        return 0
+    The grid is grown first when the rows do not fit, the new rows are
+    written and everything beneath them is cleared by the same atomic
+    request, so readers never see an empty sheet.
+    """
 
-    rows: List[List[str]] = []
-    for record in customers:
-        row: List[str] = []
-        for header in CUSTOMER_HEADERS:
-            key = CUSTOMER_FIELD_MAP[header]
-            value = record.get(key)
-            row.append("" if value is None else str(value))
-        rows.append(row)
+    rows: List[List[str]] = [
+        ["" if (value := record.get(key)) is None else str(value) for key in _CUSTOMER_KEYS]
+        for record in customers
+    ]
 
-    start_range = _a1_range(CUSTOMER_SHEET_TITLE, "A2")
-    _values_batch_update(
-        service,
-        spreadsheet_id,
-        [
+    needed_rows = 1 + len(rows)
+    grid_rows = _grid_row_count(service, spreadsheet_id, sheet_id)
+    requests: List[Dict[str, Any]] = []
+    if grid_rows < needed_rows:
+        requests.append(
             {
-                "range": start_range,
-                "values": rows,
+                "appendDimension": {
+                    "sheetId": sheet_id,
+                    "dimension": "ROWS",
+                    "length": needed_rows - grid_rows,
+                }
             }
-        ],
-    )
+        )
+        grid_rows = needed_rows
+    if rows:
+        requests.append(
+            {
+                "updateCells": {
+                    "start": {"sheetId": sheet_id, "rowIndex": 1, "columnIndex": 0},
+                    "rows": [_string_row(row) for row in rows],
+                    "fields": "userEnteredValue",
+                }
+            }
+        )
+    if grid_rows > needed_rows:
+        # Without ``rows`` updateCells clears the range: drops the stale tail.
+        requests.append(
+            {
+                "updateCells": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "startRowIndex": needed_rows,
+                        "endRowIndex": grid_rows,
+                        "startColumnIndex": 0,
+                        "endColumnIndex": len(CUSTOMER_HEADERS),
+                    },
+                    "fields": "userEnteredValue",
+                }
+            }
+        )
+    if requests:
+        request = service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"requests": requests},
+        )
+        _call_with_retry(request.execute, "spreadsheets.batchUpdate")
+
     if log_callback:
-        log_callback(f"Customers sheet synchronized ({len(rows)} rows).")
+        if rows:
+            log_callback(f"Customers sheet synchronized ({len(rows)} rows).")
+        else:
+            log_callback("Customers sheet cleared (0 rows).")
     return len(rows)
 
 
-def _append_sync_log(
-    service,
-    spreadsheet_id: str,
+def _sync_log_entry(
     *,
     direction: str,
     action: str,
     rows: int,
     duration: float,
     retries: int,
-) -> None:
-    timestamp = _utcnow_iso()
-    log_sheet_range = _a1_range(LOG_SHEET_TITLE, "A:A")
-    existing = _values_batch_get(service, spreadsheet_id, [log_sheet_range])
-    entries = existing.get("valueRanges", [{}])[0].get("values", [])
-    next_row = len(entries) + 1
+) -> List[str]:
     message = (
         f"{direction}:{action} rows={rows} duration={duration:.3f}s retries={retries}"
     )
-    data = [
+    return [_utcnow_iso(), message]
+
+
+def _string_row(values: Sequence[str]) -> Dict[str, Any]:
+    return {"values": [{"userEnteredValue": {"stringValue": str(value)}} for value in values]}
+
+
+def _finish_sync(
+    service,
+    spreadsheet_id: str,
+    sheet_ids: Mapping[str, int],
+    meta_updates: Mapping[str, str],
+    log_entry: Sequence[str],
+) -> None:
+    """Write the meta sheet and append the sync log in one ``batchUpdate``.
+
+    ``appendCells`` adds the log row after the last populated row, so the
+    log never has to be read back to find the next free row.
+    """
+
+    requests: List[Dict[str, Any]] = []
+    if meta_updates:
+        requests.append(
+            {
+                "updateCells": {
+                    "start": {"sheetId": sheet_ids[META_SHEET_TITLE], "rowIndex": 0, "columnIndex": 0},
+                    "rows": [
+                        _string_row(row) for row in _merged_meta_rows(service, spreadsheet_id, meta_updates)
+                    ],
+                    "fields": "userEnteredValue",
+                }
+            }
+        )
+    requests.append(
         {
-            "range": _a1_range(LOG_SHEET_TITLE, f"A{next_row}:B{next_row}"),
-            "values": [[timestamp, message]],
+            "appendCells": {
+                "sheetId": sheet_ids[LOG_SHEET_TITLE],
+                "rows": [_string_row(log_entry)],
+                "fields": "userEnteredValue",
+            }
         }
-    ]
-    _values_batch_update(service, spreadsheet_id, data)
+    )
+    request = service.spreadsheets().batchUpdate(
+        spreadsheetId=spreadsheet_id,
+        body={"requests": requests},
+    )
+    _call_with_retry(request.execute, "spreadsheets.batchUpdate")
 
 
 def _read_remote_rows(
     service,
     spreadsheet_id: str,
     worksheet_title: str,
+    *,
+    fill_missing_hash: bool = True,
+) -> List[SheetRow]:
+    """Return the data rows of ``worksheet_title`` keyed by their RowID.
+
+    The stored ``Hash`` column is trusted as-is.  Rows without one are hashed
+    on the fly unless ``fill_missing_hash`` is ``False``; in that case the
+    hash stays empty, so recording it as sync state makes the next ``push``
+    re-upload the row with a proper hash.
+    """
+
+    [values] = _batch_get_rows(service, spreadsheet_id, [inventory_full_range(worksheet_title)])
+    # Skip the header row; the first data row is sheet row 2.
+    rows = _parse_remote_grid(values, first_row_index=1, start=1)
+    if fill_missing_hash:
+        unhashed = [row for row in rows if not row.hash]
+        if unhashed:
+            for row, digest in zip(unhashed, _hash_rows_bulk([row.values for row in unhashed])):
+                row.values[_HASH_COL] = digest
+                row.hash = digest
+    return rows
+
+
+def _parse_remote_grid(
+    values: List[List[str]],
+    first_row_index: int,
+    start: int = 0,
+) -> List[SheetRow]:
+    """Return rows carrying a RowID from ``values[start:]``.
+
+    ``values[0]`` is sheet row ``first_row_index``.  The response lists are
+    owned by the caller, so each one is padded or trimmed in place and
+    becomes the row's value list without a copy.
+    """
+
+    rows: List[SheetRow] = []
+    width = _HEADER_COUNT
+    row_id_col = _ROW_ID_COL
+    hash_col = _HASH_COL
+    append = rows.append
+    for index in range(start, len(values)):
+        row_values = values[index]
+        length = len(row_values)
+        if length <= row_id_col:
+            continue  # Too short to carry a RowID.
+        if length < width:
+            row_values.extend([""] * (width - length))
+        elif length > width:
+            del row_values[width:]
+        row_id = row_values[row_id_col].strip()
+        if not row_id:
+            continue
+        append(
+            SheetRow(
+                row_id=row_id,
+                values=row_values,
+                hash=row_values[hash_col],
+                row_index=first_row_index + index,
+            )
+        )
+    return rows
+
+
+def _read_remote_markers(
+    service,
+    spreadsheet_id: str,
+    worksheet_title: str,
 ) -> List[SheetRow]:
-    range_a1 = inventory_full_range(worksheet_title)
-    payload = _values_batch_get(service, spreadsheet_id, [range_a1])
-    value_ranges = payload.get("valueRanges", [])
+    """Return one row per RowID with only UpdatedAt, RowID and Hash filled.
+
+    The other cells are left empty; the rows are meant for change detection
+    and sync state, not for applying to SQLite.
+    """
+
+    [values] = _batch_get_rows(service, spreadsheet_id, [_a1_range(worksheet_title, MARKER_RANGE)])
     rows: List[SheetRow] = []
-    if not value_ranges:
-        return rows
-    values = value_ranges[0].get("values", [])
-    if not values:
-        return rows
-    for index, raw_row in enumerate(values[1:], start=2):  # Skip header row
-        row_values: Dict[str, str] = {header: "" for header in HEADERS}
-        for idx, header in enumerate(HEADERS):
-            if idx < len(raw_row):
-                row_values[header] = raw_row[idx]
-        row_id = row_values.get("RowID", "").strip()
+    width = _HEADER_COUNT
+    span = _MARKER_LAST_COL - _MARKER_FIRST_COL + 1
+    for offset, cells in enumerate(values):
+        row_values = [""] * width
+        markers = cells[:span]
+        row_values[_MARKER_FIRST_COL : _MARKER_FIRST_COL + len(markers)] = markers
+        row_id = row_values[_ROW_ID_COL].strip()
         if not row_id:
             continue
-        row_values["Hash"] = row_values.get("Hash") or calc_hash(row_values)
         rows.append(
-            SheetRow(row_id=row_id, values=row_values, hash=row_values["Hash"], row_index=index)
+            SheetRow(row_id=row_id, values=row_values, hash=row_values[_HASH_COL], row_index=offset + 2)
         )
     return rows
 
 
-def _write_remote_meta(
+def _read_remote_rows_at(
+    service,
+    spreadsheet_id: str,
+    worksheet_title: str,
+    expected: Sequence[SheetRow],
+) -> Optional[List[SheetRow]]:
+    """Fetch the full rows at the positions of ``expected``.
+
+    Consecutive positions share one range.  Returns ``None`` when that
+    needs more than ``MAX_PROJECTED_RANGES`` ranges, or when a fetched row
+    no longer carries the expected RowID because the sheet changed in
+    between; callers then fall back to a full read.
+    """
+
+    indexes = sorted(row.row_index for row in expected if row.row_index)
+    runs: List[Tuple[int, int]] = []
+    for row_index in indexes:
+        if runs and row_index == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], row_index)
+        else:
+            runs.append((row_index, row_index))
+    if len(runs) > MAX_PROJECTED_RANGES:
+        return None
+    if not runs:
+        return []
+
+    grids = _batch_get_rows(
+        service,
+        spreadsheet_id,
+        [inventory_rows_range(worksheet_title, first, last) for first, last in runs],
+    )
+    fetched: Dict[int, SheetRow] = {}
+    for (first, _last), grid in zip(runs, grids):
+        for row in _parse_remote_grid(grid, first_row_index=first):
+            fetched[row.row_index] = row
+    rows: List[SheetRow] = []
+    for marker in expected:
+        row = fetched.get(marker.row_index)
+        if row is None or row.row_id != marker.row_id:
+            return None
+        rows.append(row)
+    return rows
+
+
+def _read_remote_row_indexes(
+    service,
+    spreadsheet_id: str,
+    worksheet_title: str,
+) -> Tuple[Dict[str, int], int]:
+    """Return ``({row_id: row_index}, next_row_index)`` for the worksheet.
+
+    Only the RowID column is downloaded, so callers that merely need to know
+    where each row lives avoid transferring the whole table.
+    """
+
+    [values] = _batch_get_rows(service, spreadsheet_id, [inventory_row_id_range(worksheet_title)])
+    indexes: Dict[str, int] = {}
+    last_index = 1
+    for index, cells in enumerate(values, start=2):
+        if cells and (row_id := str(cells[0]).strip()):
+            indexes[row_id] = index
+            last_index = index
+    return indexes, last_index + 1
+
+
+def _merged_meta_rows(
     service,
     spreadsheet_id: str,
     updates: Mapping[str, str],
-) -> None:
-    if not updates:
-        return
-    existing = _values_batch_get(service, spreadsheet_id, [_a1_range(META_SHEET_TITLE, "A:B")])
-    rows = existing.get("valueRanges", [{}])[0].get("values", [])
+) -> List[List[str]]:
+    """Return the meta sheet rows, header included, with ``updates`` applied."""
+
+    [rows] = _batch_get_rows(service, spreadsheet_id, [_a1_range(META_SHEET_TITLE, "A:B")])
     meta_map: Dict[str, str] = {}
     for row in rows[1:]:
         if len(row) >= 2:
@@ -1200,38 +1853,100 @@ def _write_remote_meta(
     for key, value in meta_map.items():
         if key not in META_KEYS:
             ordered.append([key, value])
-    data = [
-        {"range": _a1_range(META_SHEET_TITLE, f"A1:B{len(ordered)}"), "values": ordered}
-    ]
-    _values_batch_update(service, spreadsheet_id, data)
+    return ordered
 
 
 # ---------------------------------------------------------------------------
 # Conflict resolution and conversion helpers
 # ---------------------------------------------------------------------------
+_FROMISOFORMAT = datetime.fromisoformat
+_BACKUP_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_BACKUP_BUFFER_SIZE = 64 * 1024
+_BACKUP_DAY_FORMAT = "%Y%m%d"
+_BACKUP_LOCK = threading.Lock()
+
+
+def _append_conflict_backup(
+    backup_prefix: str,
+    row_id: str,
+    local_row: Mapping[str, Any],
+    remote_row: Mapping[str, Any],
+) -> None:
+    """Append both sides of a conflict as one line of the day's NDJSON log.
+
+    All conflicts of a day share ``{backup_prefix}-YYYYMMDD.ndjson`` instead of
+    creating two files per conflict.
+    """
+
+    now = time.gmtime()
+    record = {
+        "row_id": row_id,
+        "timestamp": time.strftime(_UTC_ISO_FORMAT, now),
+        "local": local_row,
+        "remote": remote_row,
+    }
+    line = (_BACKUP_ENCODER.encode(record) + "\n").encode("utf-8")
+    backup_dir = app_paths.ensure_directory(app_paths.BACKUP_DIR)
+    path = backup_dir / f"{backup_prefix}-{time.strftime(_BACKUP_DAY_FORMAT, now)}.ndjson"
+    try:
+        with _BACKUP_LOCK, open(path, "ab", buffering=_BACKUP_BUFFER_SIZE) as handle:
+            handle.write(line)
+    except OSError:  # pragma: no cover - filesystem guard
+        logger.warning("Conflict backup could not be written: %s", path, exc_info=True)
+
+
 def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
-    candidate = value
-    if value.endswith("Z"):
-        candidate = value[:-1] + "+00:00"
     try:
-        parsed = datetime.fromisoformat(candidate)
-    except ValueError:
+        if value[-1] == "Z":
+            parsed = _FROMISOFORMAT(value[:-1] + "+00:00")
+        else:
+            parsed = _FROMISOFORMAT(value)
+    except (TypeError, ValueError):
         return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    else:
-        parsed = parsed.astimezone(timezone.utc)
-    return parsed
+    tzinfo = parsed.tzinfo
+    if tzinfo is timezone.utc:
+        return parsed
+    if tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _rows_updated_since(rows: Iterable[SheetRow], since: datetime) -> List[SheetRow]:
+    """Return the rows whose UpdatedAt is later than ``since``.
+
+    Bulk imports and pushes stamp many rows with the same value, so each
+    distinct UpdatedAt string is parsed only once.
+    """
+
+    verdicts: Dict[str, bool] = {}
+    changed: List[SheetRow] = []
+    for row in rows:
+        text = row.values[_UPDATED_AT_COL]
+        newer = verdicts.get(text)
+        if newer is None:
+            updated_at = _parse_timestamp(text)
+            newer = verdicts[text] = updated_at is not None and updated_at > since
+        if newer:
+            changed.append(row)
+    return changed
 
 
 def _to_int(value: Any, default: int = 0) -> int:
+    if value is None or value == "":
+        return default
+    if type(value) is int:
+        return value
     try:
-        if value is None or value == "":
-            return default
-        return int(float(str(value)))
-    except (TypeError, ValueError):
+        if type(value) is float:
+            return int(value)
+        text = str(value)
+        try:
+            return int(text)
+        except ValueError:
+            return int(float(text))
+    except (TypeError, ValueError, OverflowError):
         return default
 
 
@@ -1241,10 +1956,18 @@ def resolve_conflict(
     *,
     backup_prefix: str = "sheet-conflict",
 ) -> Dict[str, Any]:
-    """Merge conflicting rows field-by-field using UpdatedAt timestamps."""
+    """Merge conflicting rows field-by-field using UpdatedAt timestamps.
+
+    Rows that carry the same ``UpdatedAt`` text and identical field values are
+    returned as a plain copy of ``remote_row`` without parsing timestamps.
+    """
+
+    if local_row.get("UpdatedAt") == remote_row.get("UpdatedAt") and all(
+        str(local_row.get(header)) == str(remote_row.get(header))
+        for header in _MERGEABLE_HEADERS
+    ):
+        return dict(remote_row)
 
-    backup_dir = app_paths.ensure_directory(app_paths.BACKUP_DIR)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     row_id = remote_row.get("RowID") or local_row.get("RowID") or "unknown"
     local_ts = _parse_timestamp(local_row.get("UpdatedAt"))
     remote_ts = _parse_timestamp(remote_row.get("UpdatedAt"))
@@ -1252,12 +1975,12 @@ def resolve_conflict(
     merged = dict(remote_row)
     field_diffs: Dict[str, Tuple[str, str]] = {}
 
-    for header in HEADERS:
-        if header in {"RowID", "Hash", "UpdatedAt"}:
-            continue
+    for header in _MERGEABLE_HEADERS:
         local_value = local_row.get(header)
         remote_value = remote_row.get(header)
-        if str(local_value) == str(remote_value):
+        local_text = str(local_value)
+        remote_text = str(remote_value)
+        if local_text == remote_text:
             merged[header] = remote_value
             continue
         if local_ts and remote_ts:
@@ -1276,30 +1999,24 @@ def resolve_conflict(
 
         # Equal or missing timestamps – favour remote but record the difference
         merged[header] = remote_value
-        field_diffs[header] = (str(local_value or ""), str(remote_value or ""))
+        field_diffs[header] = (
+            local_text if local_value else "",
+            remote_text if remote_value else "",
+        )
 
     chosen_ts: Optional[datetime] = None
     if local_ts and remote_ts:
         chosen_ts = max(local_ts, remote_ts)
     else:
         chosen_ts = local_ts or remote_ts
-    if field_diffs:
-        chosen_ts = datetime.now(timezone.utc).replace(microsecond=0)
 
-    if chosen_ts:
+    if field_diffs:
+        merged["UpdatedAt"] = _utcnow_iso()
+    elif chosen_ts:
         merged["UpdatedAt"] = chosen_ts.isoformat().replace("+00:00", "Z")
 
-    def _backup(row: Mapping[str, Any], suffix: str) -> None:
-        path = backup_dir / f"{backup_prefix}-{row_id}-{suffix}-{timestamp}.bak.json"
-        try:
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump(row, handle, ensure_ascii=False, indent=2)
-        except OSError:  # pragma: no cover - filesystem guard
-            logger.warning("Conflict backup could not be written: %s", path, exc_info=True)
-
     if field_diffs:
-        _backup(local_row, "local")
-        _backup(remote_row, "remote")
+        _append_conflict_backup(backup_prefix, str(row_id), local_row, remote_row)
         record_conflict(row_id, field_diffs, context={"strategy": "field_merge"})
 
     return merged
@@ -1356,9 +2073,7 @@ def _flush_outbox(
     if not _OUTBOX.path.exists():
         return 0
 
-    remote_rows = _read_remote_rows(service, parsed_id, worksheet_title)
-    remote_index: Dict[str, SheetRow] = {row.row_id: row for row in remote_rows}
-    next_row_index = max((row.row_index or 1 for row in remote_rows), default=1) + 1
+    remote_index, next_row_index = _read_remote_row_indexes(service, parsed_id, worksheet_title)
 
     with _connect(db_path) as conn:
         local_index = {row.row_id: row for row in _fetch_local_rows(conn)}
@@ -1371,19 +2086,11 @@ def _flush_outbox(
         row = local_index.get(row_id)
         if row is None:
             return
-        target_index: Optional[int] = None
-        existing = remote_index.get(row_id)
-        if existing and existing.row_index is not None:
-            target_index = existing.row_index
+        target_index = remote_index.get(row_id)
         if target_index is None:
             target_index = next_row_index
             next_row_index += 1
-            remote_index[row_id] = SheetRow(
-                row_id=row.row_id,
-                values=dict(row.values),
-                hash=row.hash,
-                row_index=target_index,
-            )
+            remote_index[row_id] = target_index
         a1_range = inventory_row_range(worksheet_title, target_index)
         _values_batch_update(
             service,
@@ -1397,9 +2104,83 @@ def _flush_outbox(
     return processed
 
 
+# (batchUpdate data, rows carried by it, log label)
+_PushBatch = Tuple[List[Dict[str, Any]], List[SheetRow], str]
+
+
+def _dispatch_push_batches(
+    service,
+    credential_path: str,
+    spreadsheet_id: str,
+    batches: Sequence[_PushBatch],
+    *,
+    log_callback: Optional[Callable[[str], None]] = None,
+) -> Tuple[int, int]:
+    """Send ``batches`` and return ``(rows_written, retries)``.
+
+    Batches touch disjoint rows, so up to ``PUSH_WORKERS`` of them are sent
+    concurrently.  Each worker thread builds its own client because a
+    googleapiclient service shares one httplib2 connection, which is not
+    thread-safe.  Progress is reported from the calling thread.  If any
+    batch fails, the rows of every failed batch are queued to the outbox and
+    :class:`SpreadsheetAccessError` is raised once all workers finish.
+    """
+
+    written = 0
+    total_retries = 0
+    if not batches:
+        return written, total_retries
+
+    def _report(rows: Sequence[SheetRow], label: str, retries: int) -> None:
+        if log_callback:
+            log_callback(f"{len(rows)} {label} (retry={retries}).")
+
+    if len(batches) == 1 or PUSH_WORKERS <= 1:
+        for data, rows, label in batches:
+            try:
+                _, retries = _values_batch_update(service, spreadsheet_id, data)
+            except Exception as exc:  # pragma: no cover - network/IO guard
+                _queue_failed_rows(rows)
+                raise SpreadsheetAccessError(OFFLINE_QUEUE_MESSAGE) from exc
+            written += len(rows)
+            total_retries += retries
+            _report(rows, label, retries)
+        return written, total_retries
+
+    clients = threading.local()
+
+    def _send(data: List[Dict[str, Any]]) -> int:
+        client = getattr(clients, "service", None)
+        if client is None:
+            client = clients.service = get_client(credential_path)
+        _, retries = _values_batch_update(client, spreadsheet_id, data)
+        return retries
+
+    failed_rows: List[SheetRow] = []
+    first_error: Optional[BaseException] = None
+    with ThreadPoolExecutor(max_workers=min(PUSH_WORKERS, len(batches))) as executor:
+        futures = {executor.submit(_send, data): (rows, label) for data, rows, label in batches}
+        for future in as_completed(futures):
+            rows, label = futures[future]
+            try:
+                retries = future.result()
+            except Exception as exc:  # pragma: no cover - network/IO guard
+                failed_rows.extend(rows)
+                first_error = first_error or exc
+                continue
+            written += len(rows)
+            total_retries += retries
+            _report(rows, label, retries)
+    if first_error is not None:
+        _queue_failed_rows(failed_rows)
+        raise SpreadsheetAccessError(OFFLINE_QUEUE_MESSAGE) from first_error
+    return written, total_retries
+
+
 # ---------------------------------------------------------------------------
 # Public sync operations
 # ---------------------------------------------------------------------------
+@_forget_layouts_on_error
 def push(
     spreadsheet_id: str,
     credential_path: str,
@@ -1417,17 +2198,20 @@ def push(
     resolved_title = require_worksheet_title(worksheet_title)
 
     service = get_client(credential_path)
-    worksheet_id = _ensure_sheet_structure(service, parsed_id, resolved_title)
-
-    try:
-        customer_rows = db.fetch_customers_for_sheet()
-    except Exception as exc:  # pragma: no cover - defensive guard
-        raise SpreadsheetAccessError(f"Customer data could not be read: {exc}") from exc
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Read customers from SQLite while the sheet structure is verified.
+        customers_future = executor.submit(db.fetch_customers_for_sheet)
+        sheet_ids = _ensure_sheet_layout(service, parsed_id, resolved_title)
+        try:
+            customer_rows = customers_future.result()
+        except Exception as exc:  # pragma: no cover - defensive guard
+            raise SpreadsheetAccessError(f"Customer data could not be read: {exc}") from exc
 
     try:
         customer_synced = _sync_customers_sheet(
             service,
             parsed_id,
+            sheet_ids[CUSTOMER_SHEET_TITLE],
             customer_rows,
             log_callback=log_callback,
         )
@@ -1448,16 +2232,18 @@ def push(
     if processed_outbox and log_callback:
         log_callback(f"Queued {processed_outbox} rows uploaded.")
 
-    start = time.monotonic()
-    with _connect(db_path) as conn:
-        previous_hashes = _load_previous_hashes(conn)
-        local_rows = _fetch_local_rows(conn)
+    start_ns = time.perf_counter_ns()
+    # One timestamp for the whole sync: row fallbacks, hash state and meta.
+    sync_ts = _utcnow_iso()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        local_future = executor.submit(_load_push_state, db_path, sync_ts)
+        remote_index, next_row_index = _read_remote_row_indexes(
+            service, parsed_id, resolved_title
+        )
+        previous_hashes, local_rows = local_future.result()
 
     detected_new_rows, changed_rows = detect_local_deltas(local_rows, previous_hashes)
 
-    remote_rows = _read_remote_rows(service, parsed_id, resolved_title)
-    remote_index: Dict[str, SheetRow] = {row.row_id: row for row in remote_rows}
-
     new_rows: List[SheetRow] = []
     for row in detected_new_rows:
         if _debounce_row(row.row_id):
@@ -1472,86 +2258,55 @@ def push(
             if log_callback:
                 log_callback(f"Entry {row.row_id} skipped due to debounce.")
             continue
-        remote = remote_index.get(row.row_id)
-        target_index = remote.row_index if remote else row.row_index
-        if target_index is None and remote:
-            target_index = remote.row_index
+        target_index = remote_index.get(row.row_id)
         if target_index is None:
             new_rows.append(row)
         else:
             row.row_index = target_index
             updates.append((target_index, row))
 
-    # Determine append start row
-    next_row_index = max((row.row_index or 1 for row in remote_rows), default=1) + 1
-
-    total_written = 0
-    total_retries = 0
-
+    batches: List[_PushBatch] = []
     if updates:
-        batches: List[List[Tuple[int, SheetRow]]] = [list(chunk) for chunk in chunked(updates, MAX_BATCH_ROWS)]
-        for batch in batches:
-            data = []
-            for row_index, row in batch:
-                a1_range = inventory_row_range(resolved_title, row_index)
-                data.append({"range": a1_range, "values": [row.as_list()]})
-            try:
-                _, retries = _values_batch_update(service, parsed_id, data)
-            except Exception as exc:  # pragma: no cover - network/IO guard
-                _queue_failed_rows(row for _, row in batch)
-                raise SpreadsheetAccessError(OFFLINE_QUEUE_MESSAGE) from exc
-            total_written += len(batch)
-            total_retries += retries
-            if log_callback:
-                log_callback(
-                    f"{len(batch)} rows updated (retry={retries})."
-                )
-
+        updates.sort(key=lambda item: item[0])
+        for batch in _size_chunked(updates, lambda item: _estimated_row_bytes(item[1])):
+            batches.append(
+                (_coalesce_row_updates(resolved_title, batch), [row for _, row in batch], "rows updated")
+            )
     if new_rows:
-        batches = [list(chunk) for chunk in chunked(new_rows, MAX_BATCH_ROWS)]
-        for batch in batches:
-            data = []
+        for batch in _size_chunked(new_rows, _estimated_row_bytes):
             for row in batch:
                 row.row_index = next_row_index
-                data.append(
-                    {
-                        "range": inventory_row_range(resolved_title, next_row_index),
-                        "values": [row.as_list()],
-                    }
-                )
                 next_row_index += 1
-            try:
-                _, retries = _values_batch_update(service, parsed_id, data)
-            except Exception as exc:  # pragma: no cover - network/IO guard
-                _queue_failed_rows(batch)
-                raise SpreadsheetAccessError(OFFLINE_QUEUE_MESSAGE) from exc
-            total_written += len(batch)
-            total_retries += retries
-            if log_callback:
-                log_callback(
-                    f"{len(batch)} new rows added (retry={retries})."
-                )
+            data = _coalesce_row_updates(resolved_title, [(row.row_index, row) for row in batch])
+            batches.append((data, batch, "new rows added"))
+
+    total_written, total_retries = _dispatch_push_batches(
+        service,
+        credential_path,
+        parsed_id,
+        batches,
+        log_callback=log_callback,
+    )
 
+    meta_updates: Dict[str, str] = {}
     if total_written:
-        now_iso = _utcnow_iso()
-        with _connect(db_path) as conn:
-            _update_local_hash_state(conn, local_rows)
-            _write_local_meta(conn, {"last_sync_utc": now_iso, "db_version": APP_VERSION})
-        _write_remote_meta(
-            service,
-            parsed_id,
-            {"last_sync_utc": now_iso, "db_version": APP_VERSION},
-        )
+        meta_updates = {"last_sync_utc": sync_ts, "db_version": APP_VERSION}
+        with contextlib.closing(_connect(db_path)) as conn:
+            _persist_sync_state(conn, local_rows, meta_updates, sync_ts)
 
-    duration = time.monotonic() - start
-    _append_sync_log(
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
+    _finish_sync(
         service,
         parsed_id,
-        direction="push",
-        action="full" if total_written == len(local_rows) else "delta",
-        rows=total_written,
-        duration=duration,
-        retries=total_retries,
+        sheet_ids,
+        meta_updates,
+        _sync_log_entry(
+            direction="push",
+            action="full" if total_written == len(local_rows) else "delta",
+            rows=total_written,
+            duration=duration,
+            retries=total_retries,
+        ),
     )
 
     new_count = len([row for row in new_rows if row.row_index and row.row_index >= 0])
@@ -1565,6 +2320,7 @@ def push(
     }
 
 
+@_forget_layouts_on_error
 def pull(
     spreadsheet_id: str,
     credential_path: str,
@@ -1582,63 +2338,62 @@ def pull(
     resolved_title = require_worksheet_title(worksheet_title)
 
     service = get_client(credential_path)
-    _ensure_sheet_structure(service, parsed_id, resolved_title)
-
-    start = time.monotonic()
-    with _connect(db_path) as conn:
-        meta = _read_local_meta(conn)
+    sheet_ids = _ensure_sheet_layout(service, parsed_id, resolved_title)
+
+    start_ns = time.perf_counter_ns()
+    # Taken before the sheet is read, so edits made while this pull runs
+    # are newer than last_pull_utc and get picked up next time.
+    sync_ts = _utcnow_iso()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        local_future = executor.submit(_load_pull_state, db_path)
+        # Only the UpdatedAt/RowID/Hash block is downloaded up front; full
+        # rows are fetched for the changed subset below.
+        remote_rows = _read_remote_markers(service, parsed_id, resolved_title)
+        meta, previous_hashes = local_future.result()
     last_pull = _parse_timestamp(meta.get("last_pull_utc")) if meta else None
 
-    remote_rows = _read_remote_rows(service, parsed_id, resolved_title)
-    changed: List[SheetRow] = []
-    for row in remote_rows:
-        updated_at = _parse_timestamp(row.values.get("UpdatedAt"))
-        if last_pull is None or (updated_at and updated_at > last_pull):
-            changed.append(row)
+    changed: Optional[List[SheetRow]] = None
+    if last_pull is not None:
+        candidates = _rows_updated_since(remote_rows, last_pull)
+        changed = _read_remote_rows_at(service, parsed_id, resolved_title, candidates)
+    if changed is None:
+        remote_rows = _read_remote_rows(
+            service, parsed_id, resolved_title, fill_missing_hash=False
+        )
+        changed = remote_rows if last_pull is None else _rows_updated_since(remote_rows, last_pull)
 
-    applied = 0
+    payloads: List[Dict[str, Any]] = []
     with _connect(db_path) as conn:
-        previous_hashes = _load_previous_hashes(conn)
+        # Load every local row that may conflict in one pass instead of
+        # issuing a SELECT per changed remote row.
+        existing_rows = _fetch_local_rows_by_id(
+            conn, [row.row_id for row in changed if row.row_id in previous_hashes]
+        )
         for row in changed:
-            payload = _sheet_row_to_db_payload(row.values)
-            local_row = previous_hashes.get(row.row_id)
-            if local_row is not None:
-                # Retrieve current local row for conflict resolution
-                local_cursor = conn.execute(
-                    "SELECT item_id, rug_no, upc, roll_no, v_rug_no, v_collection, collection, "
-                    "v_design, design, brand_name, ground, border, a_size, st_size, area, type, "
-                    "rate, amount, shape, style, image_file_name, origin, retail, sp, msrp, cost, "
-                    "qty, created_at, updated_at, version, status, location, consignment_id, "
-                    "sold_at, customer_id, sale_price, sale_note "
-                    "FROM item WHERE item_id = ?",
-                    (row.row_id,),
-                )
-                existing_row = local_cursor.fetchone()
-                if existing_row:
-                    local_sheet = _sqlite_row_to_sheet(existing_row)
-                    winning = resolve_conflict(local_sheet.values, row.values)
-                    payload = _sheet_row_to_db_payload(winning)
-            db.upsert_item(payload)
-            applied += 1
-        _update_local_hash_state(conn, remote_rows)
-        now_iso = _utcnow_iso()
-        _write_local_meta(conn, {"last_pull_utc": now_iso, "db_version": APP_VERSION})
-
-    duration = time.monotonic() - start
-    now_remote = _utcnow_iso()
-    _write_remote_meta(
-        service,
-        parsed_id,
-        {"last_pull_utc": now_remote, "db_version": APP_VERSION},
-    )
-    _append_sync_log(
+            remote_values = row.as_dict()
+            payload = _sheet_row_to_db_payload(remote_values)
+            existing_row = existing_rows.get(row.row_id)
+            if existing_row is not None:
+                local_sheet = _sqlite_row_to_sheet(existing_row, sync_ts)
+                winning = resolve_conflict(local_sheet.as_dict(), remote_values)
+                payload = _sheet_row_to_db_payload(winning)
+            payloads.append(payload)
+        applied = len(payloads)
+        _persist_sync_state(
+            conn,
+            remote_rows,
+            {"last_pull_utc": sync_ts, "db_version": APP_VERSION},
+            sync_ts,
+            item_payloads=payloads,
+        )
+
+    duration = (time.perf_counter_ns() - start_ns) / 1e9
+    _finish_sync(
         service,
         parsed_id,
-        direction="pull",
-        action="delta",
-        rows=applied,
-        duration=duration,
-        retries=0,
+        sheet_ids,
+        {"last_pull_utc": sync_ts, "db_version": APP_VERSION},
+        _sync_log_entry(direction="pull", action="delta", rows=applied, duration=duration, retries=0),
     )
 
     if log_callback:
@@ -1658,28 +2413,14 @@ def latest_remote_updated_at(
 
     resolved_title = require_worksheet_title(worksheet_title)
 
-    try:
-        updated_index = HEADERS.index("UpdatedAt") + 1
-    except ValueError:
-        return None
-    column = _column_a1(updated_index)
-    range_spec = _a1_range(resolved_title, f"{column}2:{column}")
-
-    response = (
-        service.spreadsheets()
-        .values()
-        .get(spreadsheetId=parsed_id, range=range_spec)
-        .execute()
-    )
+    range_spec = _a1_range(resolved_title, f"{UPDATED_AT_COLUMN}2:{UPDATED_AT_COLUMN}")
+
+    request = service.spreadsheets().values().get(spreadsheetId=parsed_id, range=range_spec, fields="values")
+    response, _ = _call_with_retry(request.execute, "values.get")
 
     values = response.get("values", []) if isinstance(response, dict) else []
-    latest: Optional[datetime] = None
-    for row in values:
-        if not row:
-            continue
-        candidate = _parse_timestamp(row[0])
-        if candidate and (latest is None or candidate > latest):
-            latest = candidate
+    candidates = (_parse_timestamp(row[0]) for row in values if row)
+    latest = max((candidate for candidate in candidates if candidate), default=None)
     if latest is None:
         return None
     return latest.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -1715,7 +2456,7 @@ def health_check(
     service = get_client(credential_path, payload)
 
     try:
-        metadata = _spreadsheet_get(service, parsed_id)
+        metadata = _spreadsheet_get(service, parsed_id, fields=_SHEET_PROPERTIES_FIELDS)
     except HttpError as exc:  # pragma: no cover - network interaction
         status = _http_status(exc)
         if status == 403:
@@ -1725,7 +2466,7 @@ def health_check(
         raise SpreadsheetAccessError(f"Sheets read failed: {exc}") from exc
 
     resolved_title, resolved_id = _resolve_worksheet(metadata, resolved_title, sheet_gid)
-    worksheet_id = _ensure_sheet_structure(service, parsed_id, resolved_title)
+    worksheet_id = _ensure_sheet_structure(service, parsed_id, resolved_title, use_cache=False)
     if worksheet_id is None and resolved_id is not None:
         worksheet_id = resolved_id
 
@@ -1768,11 +2509,24 @@ def open_logs() -> str:
     return str(log_path)
 
 
-def ensure_sheet(service, spreadsheet_id: str, worksheet_title: str) -> int:
-    """Ensure the spreadsheet contains the expected worksheet structure."""
+@_forget_layouts_on_error
+def read_sheet_rows(
+    service,
+    spreadsheet_id: str,
+    worksheet_title: Optional[str] = None,
+) -> List[SheetRow]:
+    """Return the worksheet's data rows as :class:`SheetRow` objects.
+
+    Each row keeps its ``row_index``, so the result can be handed to
+    :func:`upsert_rows` as ``existing`` to skip a second read.
+    """
+
+    parsed_id = parse_spreadsheet_id(spreadsheet_id)
+    if not parsed_id:
+        raise SpreadsheetAccessError("A valid Sheet ID is required.")
 
     resolved_title = require_worksheet_title(worksheet_title)
-    return _ensure_sheet_structure(service, spreadsheet_id, resolved_title)
+    return _read_remote_rows(service, parsed_id, resolved_title)
 
 
 def read_rows(
@@ -1782,22 +2536,24 @@ def read_rows(
 ) -> List[Dict[str, str]]:
     """Return raw sheet rows as dictionaries keyed by ``HEADERS``."""
 
-    parsed_id = parse_spreadsheet_id(spreadsheet_id)
-    if not parsed_id:
-        raise SpreadsheetAccessError("A valid Sheet ID is required.")
-
-    resolved_title = require_worksheet_title(worksheet_title)
-    remote_rows = _read_remote_rows(service, parsed_id, resolved_title)
-    return [dict(row.values) for row in remote_rows]
+    return [row.as_dict() for row in read_sheet_rows(service, spreadsheet_id, worksheet_title)]
 
 
+@_forget_layouts_on_error
 def upsert_rows(
     service,
     spreadsheet_id: str,
     rows: Sequence[Mapping[str, Any]],
     worksheet_title: Optional[str] = None,
+    *,
+    existing: Optional[Sequence[SheetRow]] = None,
 ) -> None:
-    """Insert or update the provided ``rows`` on the remote worksheet."""
+    """Insert or update the provided ``rows`` on the remote worksheet.
+
+    ``existing`` may carry the rows returned by :func:`read_sheet_rows` for
+    the same worksheet; their positions are reused instead of reading the
+    RowID column again.
+    """
 
     if not rows:
         return
@@ -1807,59 +2563,55 @@ def upsert_rows(
         raise SpreadsheetAccessError("A valid Sheet ID is required.")
 
     resolved_title = require_worksheet_title(worksheet_title)
-    remote_rows = _read_remote_rows(service, parsed_id, resolved_title)
-    remote_index: Dict[str, SheetRow] = {row.row_id: row for row in remote_rows}
-    next_row_index = max((row.row_index or 1 for row in remote_rows), default=1) + 1
+    if existing is None:
+        remote_index, next_row_index = _read_remote_row_indexes(service, parsed_id, resolved_title)
+    else:
+        remote_index = {row.row_id: row.row_index for row in existing if row.row_index}
+        next_row_index = max(remote_index.values(), default=1) + 1
 
-    pending_updates: List[Dict[str, Any]] = []
+    pending_updates: List[Tuple[int, SheetRow]] = []
+
+    def flush() -> None:
+        pending_updates.sort(key=lambda item: item[0])
+        _values_batch_update(service, parsed_id, _coalesce_row_updates(resolved_title, pending_updates))
+        pending_updates.clear()
 
     for raw_row in rows:
         if isinstance(raw_row, SheetRow):
             prepared = SheetRow(
                 row_id=raw_row.row_id,
-                values=dict(raw_row.values),
+                values=list(raw_row.values),
                 hash=raw_row.hash,
                 row_index=raw_row.row_index,
             )
         else:
             if not isinstance(raw_row, Mapping):
                 raise SheetsSyncError("Rows must be mappings or SheetRow instances for upsert.")
-            values: Dict[str, str] = {header: "" for header in HEADERS}
-            for header in HEADERS:
-                value = raw_row.get(header)
-                values[header] = "" if value is None else str(value)
-            row_id = str(values.get("RowID") or "").strip()
+            values: List[str] = [
+                "" if (value := raw_row.get(header)) is None else str(value) for header in HEADERS
+            ]
+            row_id = values[_ROW_ID_COL].strip()
             if not row_id:
                 logger.debug("Skipping upsert row without RowID: %s", raw_row)
                 continue
-            values["RowID"] = row_id
-            if not values.get("Hash"):
-                values["Hash"] = calc_hash(values)
-            prepared = SheetRow(row_id=row_id, values=values, hash=values["Hash"])
-
-        target_index: Optional[int] = None
-        existing = remote_index.get(prepared.row_id)
-        if existing and existing.row_index is not None:
-            target_index = existing.row_index
+            values[_ROW_ID_COL] = row_id
+            if not values[_HASH_COL]:
+                values[_HASH_COL] = _hash_values(values)
+            prepared = SheetRow(row_id=row_id, values=values, hash=values[_HASH_COL])
+
+        target_index = remote_index.get(prepared.row_id)
         if target_index is None:
             target_index = next_row_index
             next_row_index += 1
         prepared.row_index = target_index
-        remote_index[prepared.row_id] = prepared
-
-        pending_updates.append(
-            {
-                "range": inventory_row_range(resolved_title, target_index),
-                "values": [prepared.as_list()],
-            }
-        )
+        remote_index[prepared.row_id] = target_index
 
+        pending_updates.append((target_index, prepared))
         if len(pending_updates) >= MAX_BATCH_ROWS:
-            _values_batch_update(service, parsed_id, pending_updates)
-            pending_updates.clear()
+            flush()
 
     if pending_updates:
-        _values_batch_update(service, parsed_id, pending_updates)
+        flush()
 
 
 __all__ = [
@@ -1883,6 +2635,7 @@ __all__ = [
     "open_logs",
     "resolve_conflict",
     "read_rows",
+    "read_sheet_rows",
     "upsert_rows",
     "SheetsSyncError",
     "MissingDependencyError",
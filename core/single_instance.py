@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import os
+import re
 import tempfile
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -14,6 +15,10 @@ else:  # pragma: no cover - POSIX branch
     import fcntl  # type: ignore[import-not-found]
 
 
+# \W is exactly "not str.isalnum() and not '_'", so names map as before.
+_UNSAFE_CHAR_RE = re.compile(r"\W")
+
+
 class SingleInstanceError(RuntimeError):
     """Raised when another RugBase instance is already running."""
 
@@ -23,7 +28,7 @@ class _InstanceLock:
     """Simple lock wrapper around a filesystem-backed mutex."""
 
     name: str
-    _file_handle: Optional[object] = None
+    _fd: Optional[int] = None
     _lock_path: Optional[Path] = None
 
     def acquire(self) -> "_InstanceLock":
@@ -31,45 +36,47 @@ class _InstanceLock:
         lock_path = Path(tempfile.gettempdir()) / lock_filename
         lock_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handle = open(lock_path, "a+b")
-        file_handle.seek(0)
+        # A raw descriptor avoids the buffered file object; O_BINARY only
+        # exists on Windows and O_CLOEXEC only on POSIX.
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+        fd = os.open(lock_path, flags, 0o644)
         try:
-            self._lock_file(file_handle)
+            self._lock_file(fd)
         except OSError as exc:
-            file_handle.close()
+            os.close(fd)
             raise SingleInstanceError(f"{self.name} is already running.") from exc
 
+        pid = str(os.getpid()).encode("ascii")
         try:
-            file_handle.seek(0)
-            file_handle.truncate()
-            file_handle.write(str(os.getpid()).encode("utf-8"))
-            file_handle.flush()
+            os.write(fd, pid)
+            os.ftruncate(fd, len(pid))
         except OSError:
             # If writing the PID fails we still hold the lock; ignore silently.
             pass
 
-        self._file_handle = file_handle
+        self._fd = fd
         self._lock_path = lock_path
         return self
 
     def release(self) -> None:
-        file_handle = self._file_handle
-        if not file_handle:
+        fd = self._fd
+        if fd is None:
             return
 
         try:
             try:
-                file_handle.seek(0)
+                # msvcrt unlocks from the current position, where the lock began.
+                os.lseek(fd, 0, os.SEEK_SET)
             except OSError:
                 # If resetting the pointer fails we still try to release the lock.
                 pass
 
-            self._unlock_file(file_handle)
+            self._unlock_file(fd)
         finally:
             try:
-                file_handle.close()
+                os.close(fd)
             finally:
-                self._file_handle = None
+                self._fd = None
 
         lock_path = self._lock_path
         if lock_path and lock_path.exists():
@@ -87,23 +94,22 @@ class _InstanceLock:
 
     @staticmethod
     def _sanitize_name(name: str) -> str:
-        safe = [char if char.isalnum() else "_" for char in name]
-        value = "".join(safe).strip("_")
+        value = _UNSAFE_CHAR_RE.sub("_", name).strip("_")
         return value or "rugbase"
 
     @staticmethod
-    def _lock_file(handle: object) -> None:
+    def _lock_file(fd: int) -> None:
         if os.name == "nt":  # pragma: no cover - Windows specific branch
-            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
         else:  # pragma: no cover - POSIX branch
-            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
 
     @staticmethod
-    def _unlock_file(handle: object) -> None:
+    def _unlock_file(fd: int) -> None:
         if os.name == "nt":  # pragma: no cover - Windows specific branch
-            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
         else:  # pragma: no cover - POSIX branch
-            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            fcntl.flock(fd, fcntl.LOCK_UN)
 
 
 def acquire_instance_lock(name: str = "RugBase") -> _InstanceLock:
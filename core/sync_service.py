@@ -210,15 +210,23 @@ class SyncService:
 
         stats = {"inserted": 0, "updated": 0, "skipped": 0, "conflicts": 0}
 
-        for raw_row in remote_rows:
-            remote = _normalise_remote_row(raw_row)
+        remote_norm = [_normalise_remote_row(raw_row) for raw_row in remote_rows]
+        local_index = db.fetch_items_for_sync_by_ids(row.get("id") for row in remote_norm)
+        # Rows written during this pull are re-read in case the sheet repeats an id.
+        touched: set[str] = set()
+
+        for remote in remote_norm:
             item_id = remote.get("id")
             if not item_id:
                 self._log("Sheets row missing identifier; skipped.")
                 stats["skipped"] += 1
                 continue
 
-            local = db.fetch_item_for_sync(item_id)
+            if item_id in touched:
+                local = db.fetch_item_for_sync(item_id)
+            else:
+                local = local_index.get(item_id)
+                touched.add(item_id)
             if not local:
                 db.apply_remote_sync_row(remote)
                 self._log(f"Sheets -> SQLite: new record added ({item_id})")
@@ -275,9 +283,10 @@ class SyncService:
         client = sheets_sync.get_client(settings.credential_path)
         worksheet_title = sheets_sync.require_worksheet_title(settings.worksheet_title)
         sheets_sync.ensure_sheet(client, settings.spreadsheet_id, worksheet_title)
-        remote_rows = sheets_sync.read_rows(
+        sheet_rows = sheets_sync.read_sheet_rows(
             client, settings.spreadsheet_id, worksheet_title
         )
+        remote_rows = [row.as_dict() for row in sheet_rows]
         remote_index = {
             row.get("id"): _normalise_remote_row(row) for row in remote_rows if row.get("id")
         }
@@ -343,6 +352,7 @@ class SyncService:
                 settings.spreadsheet_id,
                 pending_updates,
                 worksheet_title,
+                existing=sheet_rows,
             )
         self._persist_metadata(client, settings)
 
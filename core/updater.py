@@ -11,6 +11,7 @@ from __future__ import annotations
 import json
 import os
 import pathlib
+import re
 import subprocess
 import sys
 import tempfile
@@ -305,11 +306,13 @@ def _current_executable() -> pathlib.Path:
     return fallback
 
 
+_UNSAFE_CHAR_RE = re.compile(r"\W")
+
+
 def _sanitize_for_filename(value: str) -> str:
     if not value:
         return "latest"
-    safe_chars = [c if c.isalnum() else "_" for c in value]
-    sanitized = "".join(safe_chars).strip("_")
+    sanitized = _UNSAFE_CHAR_RE.sub("_", value).strip("_")
     return sanitized or "latest"
 
 
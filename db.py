@@ -490,15 +490,19 @@ def _prepare_item_payload(
     item_data: Mapping[str, Any],
     *,
     item_id: str,
-    existing: Optional[sqlite3.Row],
+    existing: Optional[Mapping[str, Any]],
     override_version: Optional[int] = None,
     override_updated_at: Optional[str] = None,
 ) -> Dict[str, Any]:
     record: Dict[str, Any] = dict(existing) if existing else {}
-    for key, value in item_data.items():
-        column = ITEM_FIELD_ALIASES.get(key, key)
-        if column in ITEM_COLUMN_DEFINITIONS:
-            record[column] = value
+    if _ITEM_COLUMN_SET.issuperset(item_data.keys()):
+        # Column names are never aliases, so canonical rows merge in one call.
+        record.update(item_data)
+    else:
+        for key, value in item_data.items():
+            column = ITEM_FIELD_ALIASES.get(key, key)
+            if column in ITEM_COLUMN_DEFINITIONS:
+                record[column] = value
 
     record["item_id"] = item_id
     record["qty"] = _coerce_int(record.get("qty"), default=0)
@@ -536,7 +540,53 @@ def _prepare_item_payload(
     return payload
 
 
+_ITEM_COLUMNS: Tuple[str, ...] = tuple(ITEM_COLUMN_DEFINITIONS)
+_ITEM_COLUMN_SET = frozenset(_ITEM_COLUMNS)
+_ITEM_UPSERT_SQL = (
+    f"INSERT INTO item ({', '.join(_ITEM_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _ITEM_COLUMNS)}) "
+    "ON CONFLICT(item_id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _ITEM_COLUMNS if column != "item_id")
+)
+# Single-row statements for full payloads from _prepare_item_payload.
+_ITEM_INSERT_SQL = (
+    f"INSERT INTO item ({', '.join(_ITEM_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _ITEM_COLUMNS)})"
+)
+_ITEM_UPDATE_COLUMNS: Tuple[str, ...] = tuple(column for column in _ITEM_COLUMNS if column != "item_id")
+_ITEM_UPDATE_SQL = (
+    f"UPDATE item SET {', '.join(f'{column} = ?' for column in _ITEM_UPDATE_COLUMNS)} WHERE item_id = ?"
+)
+_SQL_VARIABLE_CHUNK = 500
+
+
+def _resolve_item_id(item_data: Mapping[str, Any]) -> str:
+    return str(
+        item_data.get("item_id")
+        or item_data.get("RowID")
+        or item_data.get("id")
+        or uuid.uuid4()
+    )
+
+
+def _fetch_existing_items(
+    conn: sqlite3.Connection, item_ids: Sequence[str]
+) -> Dict[str, sqlite3.Row]:
+    existing: Dict[str, sqlite3.Row] = {}
+    unique_ids = list(dict.fromkeys(item_ids))
+    for start in range(0, len(unique_ids), _SQL_VARIABLE_CHUNK):
+        chunk = unique_ids[start : start + _SQL_VARIABLE_CHUNK]
+        placeholders = ", ".join("?" for _ in chunk)
+        cursor = conn.execute(f"SELECT * FROM item WHERE item_id IN ({placeholders})", chunk)
+        for row in cursor.fetchall():
+            existing[str(row["item_id"])] = row
+    return existing
+
+
 def _insert_item_row(conn: sqlite3.Connection, payload: Mapping[str, Any]) -> None:
+    if payload.keys() == _ITEM_COLUMN_SET:
+        conn.execute(_ITEM_INSERT_SQL, [payload[column] for column in _ITEM_COLUMNS])
+        return
     columns = list(payload.keys())
     placeholders = ", ".join(["?" for _ in columns])
     sql = f"INSERT INTO item ({', '.join(columns)}) VALUES ({placeholders})"
@@ -544,6 +594,11 @@ def _insert_item_row(conn: sqlite3.Connection, payload: Mapping[str, Any]) -> No
 
 
 def _update_item_row(conn: sqlite3.Connection, item_id: str, payload: Mapping[str, Any]) -> None:
+    if payload.keys() == _ITEM_COLUMN_SET:
+        values = [payload[column] for column in _ITEM_UPDATE_COLUMNS]
+        values.append(item_id)
+        conn.execute(_ITEM_UPDATE_SQL, values)
+        return
     assignments = ", ".join([f"{column} = ?" for column in payload.keys() if column != "item_id"])
     values = [payload[column] for column in payload.keys() if column != "item_id"]
     values.append(item_id)
@@ -651,12 +706,7 @@ def fetch_item(item_id: str) -> Optional[Dict[str, Any]]:
 
 
 def upsert_item(item_data: Mapping[str, Any]) -> Tuple[str, bool]:
-    item_id = str(
-        item_data.get("item_id")
-        or item_data.get("RowID")
-        or item_data.get("id")
-        or uuid.uuid4()
-    )
+    item_id = _resolve_item_id(item_data)
 
     with get_connection() as conn:
         cursor = conn.execute("SELECT * FROM item WHERE item_id = ?", (item_id,))
@@ -676,6 +726,53 @@ def upsert_item(item_data: Mapping[str, Any]) -> Tuple[str, bool]:
     return item_id, created
 
 
+def _write_items(
+    conn: sqlite3.Connection, items: Sequence[Mapping[str, Any]]
+) -> List[Tuple[str, bool]]:
+    item_ids = [_resolve_item_id(item) for item in items]
+    results: List[Tuple[str, bool]] = []
+    existing_rows: Dict[str, Mapping[str, Any]] = dict(_fetch_existing_items(conn, item_ids))
+    parameters: List[Tuple[Any, ...]] = []
+    for item_id, item_data in zip(item_ids, items):
+        existing = existing_rows.get(item_id)
+        payload = _prepare_item_payload(item_data, item_id=item_id, existing=existing)
+        parameters.append(tuple(payload[column] for column in _ITEM_COLUMNS))
+        existing_rows[item_id] = payload
+        results.append((item_id, existing is None))
+    conn.executemany(_ITEM_UPSERT_SQL, parameters)
+    return results
+
+
+def upsert_items_many(
+    items: Sequence[Mapping[str, Any]],
+    *,
+    conn: Optional[sqlite3.Connection] = None,
+) -> List[Tuple[str, bool]]:
+    """Upsert ``items`` in one transaction, returning ``(item_id, created)`` pairs.
+
+    Behaves like calling :func:`upsert_item` for every entry but loads the
+    existing rows with batched ``IN`` queries and writes them with a single
+    ``executemany`` so the commit cost is paid once per batch.
+
+    When ``conn`` is given the rows are written inside the caller's open
+    transaction instead; the caller commits, and upsert listeners are not
+    notified.
+    """
+
+    if not items:
+        return []
+
+    if conn is not None:
+        return _write_items(conn, items)
+
+    with transaction() as own_conn:
+        results = _write_items(own_conn, items)
+
+    for item_id, _created in results:
+        _notify_item_upsert(item_id)
+    return results
+
+
 def delete_item(item_id: str) -> None:
     with get_connection() as conn:
         conn.execute("DELETE FROM item WHERE item_id = ?", (item_id,))
@@ -803,6 +900,17 @@ def fetch_item_for_sync(item_id: str) -> Optional[Dict[str, Any]]:
         return _item_row_to_sync_payload(dict(row)) if row else None
 
 
+def fetch_items_for_sync_by_ids(item_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Return sync payloads for ``item_ids`` keyed by id, using chunked ``IN`` queries."""
+
+    ids = [str(item_id) for item_id in item_ids if item_id]
+    if not ids:
+        return {}
+    with get_connection() as conn:
+        rows = _fetch_existing_items(conn, ids)
+    return {item_id: _item_row_to_sync_payload(dict(row)) for item_id, row in rows.items()}
+
+
 def apply_remote_sync_row(row: Mapping[str, Any]) -> None:
     item_id = str(
         row.get("id")
@@ -961,6 +1069,7 @@ __all__ = [
     "fetch_items",
     "fetch_item",
     "upsert_item",
+    "upsert_items_many",
     "delete_item",
     "fetch_distinct_values",
     "fetch_customers",
@@ -979,6 +1088,7 @@ __all__ = [
     "last_sync_error",
     "fetch_items_for_sync_snapshot",
     "fetch_item_for_sync",
+    "fetch_items_for_sync_by_ids",
     "apply_remote_sync_row",
     "bump_item_version",
     "fetch_customers_for_sheet",
@@ -46,3 +46,69 @@ def test_parse_numeric_handles_currency():
     assert db.parse_numeric("$2.500,00") == pytest.approx(2500.0)
     assert db.parse_numeric("86,1") == pytest.approx(86.1)
     assert db.parse_numeric(" ") is None
+
+
+def test_upsert_items_many_matches_single_upsert(tmp_path):
+    _configure_db(tmp_path)
+    existing_id, _ = db.upsert_item({"rug_no": "RUG-1", "design": "Old"})
+
+    received: list[str] = []
+    db.add_item_upsert_listener(received.append)
+    try:
+        results = db.upsert_items_many(
+            [
+                {"item_id": existing_id, "design": "New", "qty": "3"},
+                {"item_id": "NEW-1", "rug_no": "RUG-2", "retail": "$1.000,00"},
+            ]
+        )
+    finally:
+        db.remove_item_upsert_listener(received.append)
+
+    assert results == [(existing_id, False), ("NEW-1", True)]
+    assert received == [existing_id, "NEW-1"]
+
+    updated = db.fetch_item(existing_id)
+    assert updated is not None
+    assert updated["rug_no"] == "RUG-1"
+    assert updated["design"] == "New"
+    assert updated["qty"] == 3
+    assert updated["version"] == 2
+
+    created = db.fetch_item("NEW-1")
+    assert created is not None
+    assert pytest.approx(created["retail"], rel=1e-5) == 1000.0
+    assert db.upsert_items_many([]) == []
+
+
+def test_upsert_items_many_joins_caller_transaction(tmp_path):
+    _configure_db(tmp_path)
+    received: list[str] = []
+    db.add_item_upsert_listener(received.append)
+    try:
+        conn = db.get_connection()
+        try:
+            conn.execute("BEGIN")
+            results = db.upsert_items_many([{"item_id": "TX-1", "rug_no": "RUG-TX"}], conn=conn)
+            assert results == [("TX-1", True)]
+            assert db.fetch_item("TX-1") is None
+            conn.rollback()
+        finally:
+            conn.close()
+    finally:
+        db.remove_item_upsert_listener(received.append)
+
+    assert received == []
+    assert db.fetch_item("TX-1") is None
+
+
+def test_fetch_items_for_sync_by_ids_matches_single_lookups(tmp_path):
+    _configure_db(tmp_path)
+
+    first_id, _ = db.upsert_item({"rug_no": "RUG-1"})
+    second_id, _ = db.upsert_item({"rug_no": "RUG-2"})
+
+    index = db.fetch_items_for_sync_by_ids([first_id, second_id, "missing", ""])
+
+    assert set(index) == {first_id, second_id}
+    assert index[first_id] == db.fetch_item_for_sync(first_id)
+    assert index[second_id] == db.fetch_item_for_sync(second_id)
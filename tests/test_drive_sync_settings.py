@@ -0,0 +1,121 @@
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core import drive_sync
+
+
+def _isolate_settings(tmp_path, monkeypatch) -> Path:
+    settings_path = tmp_path / "drive_sync.json"
+    monkeypatch.setattr(drive_sync, "_settings_path", lambda: settings_path)
+    monkeypatch.setattr(drive_sync, "_SETTINGS_CACHE", None)
+    monkeypatch.setattr(drive_sync, "_default_token_path", lambda: str(tmp_path / "token.json"))
+    monkeypatch.setattr(drive_sync, "_ensure_token_directory", lambda path: path)
+    monkeypatch.setattr(drive_sync, "_default_client_secret_path", lambda: "")
+    monkeypatch.setattr(drive_sync, "_normalise_client_secret_path", lambda path: str(path or ""))
+    return settings_path
+
+
+def test_load_settings_is_reused_until_the_file_changes(tmp_path, monkeypatch):
+    settings_path = _isolate_settings(tmp_path, monkeypatch)
+    drive_sync.save_settings({"poll_interval": 45})
+    reads = []
+    original_load = json.load
+    monkeypatch.setattr(drive_sync.json, "load", lambda handle: reads.append(1) or original_load(handle))
+
+    first = drive_sync.load_settings()
+    first["poll_interval"] = 1  # Callers own the returned dict.
+    second = drive_sync.load_settings()
+
+    assert second["poll_interval"] == 45
+    assert len(reads) == 1
+
+    payload = json.loads(settings_path.read_text(encoding="utf-8"))
+    payload["poll_interval"] = 120
+    settings_path.write_text(json.dumps(payload, indent=4), encoding="utf-8")
+
+    assert drive_sync.load_settings()["poll_interval"] == 120
+    assert len(reads) == 2
+
+
+def test_ensure_client_reuses_known_folder_ids(tmp_path, monkeypatch):
+    _isolate_settings(tmp_path, monkeypatch)
+    monkeypatch.setattr(drive_sync, "ROOT_FOLDER_ID", "root-id")
+    lookups = []
+    structure = (drive_sync.ROOT_FOLDER_ID, "changelog-id", "backups-id")
+    monkeypatch.setattr(drive_sync, "_ensure_structure", lambda service: lookups.append(service) or structure)
+    sync = drive_sync.DriveSync(str(tmp_path / "rugbase.db"))
+    sync._service = object()
+    settings = drive_sync.load_settings()
+
+    sync._ensure_client(settings)
+    _, resolved = sync._ensure_client(drive_sync.load_settings())
+
+    assert len(lookups) == 1
+    assert resolved == {
+        "root": drive_sync.ROOT_FOLDER_ID,
+        "changelog": "changelog-id",
+        "backups": "backups-id",
+    }
+
+
+def test_save_settings_skips_unchanged_content(tmp_path, monkeypatch):
+    settings_path = _isolate_settings(tmp_path, monkeypatch)
+    drive_sync.save_settings({"poll_interval": 45})
+    replaced = []
+    original_replace = drive_sync.os.replace
+    monkeypatch.setattr(drive_sync.os, "replace", lambda src, dst: replaced.append(dst) or original_replace(src, dst))
+
+    drive_sync.save_settings({"poll_interval": 45})
+    drive_sync.save_settings({"poll_interval": 60})
+
+    assert replaced == [settings_path]
+    assert json.loads(settings_path.read_text(encoding="utf-8"))["poll_interval"] == 60
+    assert not list(settings_path.parent.glob("*.tmp"))
+
+
+def test_backup_recovers_from_deleted_backups_folder(tmp_path, monkeypatch):
+    from googleapiclient.errors import HttpError
+    from httplib2 import Response
+
+    _isolate_settings(tmp_path, monkeypatch)
+    monkeypatch.setattr(drive_sync, "ROOT_FOLDER_ID", "root-id")
+    monkeypatch.setattr(drive_sync, "_ensure_configured", lambda settings: None)
+    monkeypatch.setattr(drive_sync.drive_api, "MediaFileUpload", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        drive_sync, "_ensure_structure", lambda service: ("root-id", "changelog-id", "new-backups-id")
+    )
+    settings = drive_sync.load_settings()
+    settings.update(changelog_folder_id="changelog-id", backups_folder_id="gone-id")
+    drive_sync.save_settings(settings)
+    parents = []
+
+    class _Files:
+        def create(self, body, **kwargs):
+            parents.append(body["parents"][0])
+
+            class _Request:
+                def execute(self):
+                    if body["parents"] == ["gone-id"]:
+                        raise HttpError(Response({"status": 404}), b"not found")
+                    return {"id": "backup"}
+
+            return _Request()
+
+    class _Service:
+        def files(self):
+            return _Files()
+
+    db_path = tmp_path / "rugbase.db"
+    db_path.write_bytes(b"data")
+    sync = drive_sync.DriveSync(str(db_path))
+    sync._service = _Service()
+
+    sync.backup_local()
+
+    assert parents == ["gone-id", "new-backups-id"]
+    assert drive_sync.load_settings()["backups_folder_id"] == "new-backups-id"
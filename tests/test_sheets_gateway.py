@@ -22,7 +22,7 @@ class _FakeValues:
     def __init__(self, service: "_FakeService") -> None:
         self._service = service
 
-    def get(self, spreadsheetId: str, range: str):  # noqa: N802 - API compatibility
+    def get(self, spreadsheetId: str, range: str, fields: str | None = None):  # noqa: N802 - API compatibility
         return _FakeRequest(lambda: self._service._handle_get(range))
 
     def batchUpdate(self, spreadsheetId: str, body: Dict[str, Any]):  # noqa: N802 - API compatibility
@@ -89,12 +89,14 @@ class _FakeService:
         if width == 0:
             width = len(self.sheet_rows[0]) if self.sheet_rows else len(sheets_gateway.REQUIRED_HEADERS)
 
-        new_matrix: List[List[Any]] = [["" for _ in range(width)] for _ in range(max_row)]
+        while len(self.sheet_rows) < max_row:
+            self.sheet_rows.append(["" for _ in range(width)])
         for start_row, values in parsed_updates:
             for offset, row in enumerate(values):
-                new_matrix[start_row + offset] = list(row)
-
-        self.sheet_rows = new_matrix
+                self.sheet_rows[start_row + offset] = list(row)
+        # Blank trailing rows read back as absent, as with the real API.
+        while self.sheet_rows and not any(cell not in (None, "") for cell in self.sheet_rows[-1]):
+            self.sheet_rows.pop()
         return {}
 
     @staticmethod
@@ -265,3 +267,33 @@ def test_delete_rows_removes_matching_entries() -> None:
     assert service.sheet_rows[1][0] == "R-2"
 
 
+def test_upsert_rows_writes_only_touched_rows() -> None:
+    header = list(sheets_gateway.REQUIRED_HEADERS)
+    existing = [
+        _row(RugNo=f"R-{index}", UpdatedAt="2024-01-01T00:00:00Z", Deleted=False) for index in range(4)
+    ]
+    service = _FakeService([header] + [[row.get(column) for column in header] for row in existing])
+
+    sheets_gateway.upsert_rows(
+        [{"RugNo": "R-1", "Design": "Changed"}, {"RugNo": "R-9", "Design": "New"}],
+        service=service,
+    )
+
+    [body] = service.batch_requests
+    end_column = sheets_gateway._column_letter(len(header))
+    assert [entry["range"] for entry in body["data"]] == [
+        f"'{sheets_gateway.SHEET_NAME}'!A3:{end_column}3",
+        f"'{sheets_gateway.SHEET_NAME}'!A6:{end_column}6",
+    ]
+    design_index = header.index("Design")
+    assert [row[design_index] for row in service.sheet_rows[1:]] == [None, "Changed", None, None, "New"]
+
+
+def test_upsert_rows_skips_unchanged_rows() -> None:
+    header = list(sheets_gateway.REQUIRED_HEADERS)
+    row = _row(RugNo="R-1", Design="Same", UpdatedAt="2024-01-01T00:00:00Z", Deleted=False)
+    service = _FakeService([header, [row.get(column) for column in header]])
+
+    sheets_gateway.upsert_rows([{"RugNo": "R-1", "Design": "Same"}], service=service)
+
+    assert service.batch_requests == []
@@ -0,0 +1,325 @@
+import contextlib
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import db
+from core import sheets_sync
+
+
+def _configure_db(tmp_path: Path) -> Path:
+    db_path = tmp_path / "sheets_sync.db"
+    db.set_database_path(db_path)
+    db.initialize_database()
+    return db_path
+
+
+def test_utcnow_iso_uses_z_suffix_without_microseconds():
+    value = sheets_sync._utcnow_iso()
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z", value)
+    assert sheets_sync._parse_timestamp(value) is not None
+
+
+def test_parse_timestamp_normalises_to_utc():
+    expected = sheets_sync._parse_timestamp("2024-01-01T12:00:00Z")
+    assert expected is not None
+    assert expected.tzinfo is sheets_sync.timezone.utc
+    assert sheets_sync._parse_timestamp("2024-01-01T12:00:00") == expected
+    assert sheets_sync._parse_timestamp("2024-01-01T14:00:00+02:00") == expected
+    assert sheets_sync._parse_timestamp("not a date") is None
+    assert sheets_sync._parse_timestamp("") is None
+
+
+def test_resolve_conflict_prefers_newer_side_per_field():
+    local = {"RowID": "1", "Design": "Local", "Qty": "2", "UpdatedAt": "2024-01-02T00:00:00Z"}
+    remote = {"RowID": "1", "Design": "Remote", "Qty": "2", "UpdatedAt": "2024-01-01T00:00:00Z"}
+
+    merged = sheets_sync.resolve_conflict(local, remote)
+
+    assert merged["Design"] == "Local"
+    assert merged["Qty"] == "2"
+    assert merged["UpdatedAt"] == "2024-01-02T00:00:00Z"
+
+
+def test_fetch_local_rows_by_id_loads_requested_rows(tmp_path, monkeypatch):
+    db_path = _configure_db(tmp_path)
+    monkeypatch.setattr(sheets_sync, "_SQL_IN_CHUNK", 2)
+    ids = [db.upsert_item({"rug_no": f"RUG-{index}"})[0] for index in range(5)]
+
+    with sheets_sync._connect(str(db_path)) as conn:
+        found = sheets_sync._fetch_local_rows_by_id(conn, ids[:4] + ["missing"])
+
+    assert sorted(found) == sorted(ids[:4])
+    assert found[ids[0]]["rug_no"] == "RUG-0"
+
+
+
+def test_fetch_local_rows_reads_tuples_in_batches(tmp_path, monkeypatch):
+    db_path = _configure_db(tmp_path)
+    monkeypatch.setattr(sheets_sync, "_FETCH_BATCH_SIZE", 2)
+    ids = [db.upsert_item({"rug_no": f"RUG-{index}", "qty": 3})[0] for index in range(3)]
+    with sheets_sync._connect(str(db_path)) as conn:
+        conn.execute("UPDATE item SET status = 'archived' WHERE item_id = ?", (ids[0],))
+
+    with sheets_sync._connect(str(db_path)) as conn:
+        rows = {row.row_id: row for row in sheets_sync._fetch_local_rows(conn)}
+
+    assert sorted(rows) == sorted(ids)
+    archived = rows[ids[0]].as_dict()
+    assert archived["RugNo"] == "RUG-0"
+    assert archived["Qty"] == "3"
+    assert (archived["Status"], archived["Deleted"]) == ("archived", "TRUE")
+    assert rows[ids[1]].get("Deleted") == ""
+    assert rows[ids[1]].hash == sheets_sync.calc_hash(rows[ids[1]].as_dict())
+    assert rows[ids[1]].raw_hash == bytes.fromhex(rows[ids[1]].hash)
+
+
+def test_resolve_conflict_appends_backups_to_daily_log(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.setattr(sheets_sync.app_paths, "BACKUP_DIR", tmp_path / "backups")
+    local = {"RowID": "7", "Design": "Çini"}
+    remote = {"RowID": "7", "Design": "Kilim"}
+
+    merged = sheets_sync.resolve_conflict(local, remote)
+    sheets_sync.resolve_conflict(dict(local, RowID="8"), dict(remote, RowID="8"))
+
+    assert merged["Design"] == "Kilim"
+    [log] = (tmp_path / "backups").glob("sheet-conflict-*.ndjson")
+    lines = log.read_text(encoding="utf-8").splitlines()
+    assert '"Design":"Çini"' in lines[0]
+    records = [json.loads(line) for line in lines]
+    assert [record["row_id"] for record in records] == ["7", "8"]
+    assert records[0]["local"] == local
+    assert records[0]["remote"] == remote
+
+
+def test_size_chunked_respects_byte_budget():
+    items = ["a" * 40, "b" * 40, "c" * 30, "d" * 200, "e" * 10]
+
+    batches = list(sheets_sync._size_chunked(items, len, max_bytes=100))
+
+    assert batches == [["a" * 40, "b" * 40], ["c" * 30], ["d" * 200], ["e" * 10]]
+    assert list(sheets_sync._size_chunked([], len, max_bytes=100)) == []
+
+
+def test_resolve_conflict_identical_rows_return_remote_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(sheets_sync.app_paths, "BACKUP_DIR", tmp_path / "backups")
+    row = {"RowID": "9", "Design": "Same", "Qty": "1", "UpdatedAt": "2024-01-01T00:00:00Z"}
+    remote = dict(row, Hash="abc")
+
+    merged = sheets_sync.resolve_conflict(dict(row), remote)
+
+    assert merged == remote
+    assert merged is not remote
+    assert not (tmp_path / "backups").exists()
+
+
+def test_calc_hash_is_stable_and_ignores_hash_column():
+    row = {"RowID": "1", "Design": "Kilim", "Qty": 2, "Notes": None}
+
+    digest = sheets_sync.calc_hash(row)
+
+    assert len(digest) == 64
+    assert sheets_sync.calc_hash(dict(row, Hash="stale")) == digest
+    assert sheets_sync.calc_hash(dict(row, Qty="2", Notes="")) == digest
+    assert sheets_sync.calc_hash(dict(row, Design="Other")) != digest
+
+
+def test_calc_hash_streams_fields_in_sorted_header_order():
+    import hashlib
+
+    row = {header: f"value-{index}" for index, header in enumerate(sheets_sync.HEADERS)}
+    row["Notes"] = None
+    expected = hashlib.blake2b(digest_size=32)
+    for key in sorted(sheets_sync.HEADERS):
+        if key == "Hash":
+            continue
+        value = "" if row[key] is None else row[key]
+        expected.update(f"{key}\x1f{value}\x1e".encode("utf-8"))
+
+    assert sheets_sync.calc_hash(row) == expected.hexdigest()
+    assert sheets_sync.calc_hash(dict(row, Notes="a", Origin="")) != sheets_sync.calc_hash(
+        dict(row, Notes="", Origin="a")
+    )
+
+
+def test_previous_hashes_are_loaded_as_bytes(tmp_path):
+    _configure_db(tmp_path)
+    digest = sheets_sync.calc_hash({"RowID": "1"})
+    with contextlib.closing(sheets_sync._connect()) as conn:
+        conn.execute(
+            "INSERT INTO sheet_sync_state(row_id, hash, updated_at) VALUES(?, ?, ?)",
+            ("legacy", digest, "2024-01-01T00:00:00Z"),
+        )
+        conn.commit()
+        row = sheets_sync.SheetRow(row_id="1", values=["1"], hash=digest)
+        sheets_sync._persist_sync_state(conn, [row], {})
+        hashes = sheets_sync._load_previous_hashes(conn)
+        stored_type = conn.execute(
+            "SELECT typeof(hash) FROM sheet_sync_state WHERE row_id = '1'"
+        ).fetchone()[0]
+
+    assert stored_type == "blob"
+    assert hashes == {"legacy": bytes.fromhex(digest), "1": bytes.fromhex(digest)}
+    assert sheets_sync.detect_local_deltas([row], hashes) == ([], [])
+
+
+class _BatchGetService:
+    def __init__(self, values):
+        self._values = values
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def batchGet(self, **_kwargs):  # noqa: N802 - API compatibility
+        return self
+
+    def execute(self):
+        return {"valueRanges": [{"values": self._values}]}
+
+
+def test_read_remote_rows_pads_trims_and_hashes_positionally():
+    width = len(sheets_sync.HEADERS)
+    row_id_col = sheets_sync.HEADERS.index("RowID")
+    short = [""] * (row_id_col + 1)
+    short[0], short[row_id_col] = "RUG-1", "1"
+    long = [f"c{index}" for index in range(width + 3)]
+    long[row_id_col] = "2"
+    blank_id = ["RUG-3"] + [""] * (width - 1)
+    service = _BatchGetService([list(sheets_sync.HEADERS), short, [], blank_id, long])
+
+    rows = sheets_sync._read_remote_rows(service, "sheet", "Inventory")
+
+    assert [(row.row_id, row.row_index) for row in rows] == [("1", 2), ("2", 5)]
+    assert all(len(row.values) == width for row in rows)
+    assert rows[0].get("RugNo") == "RUG-1"
+    assert rows[0].hash == sheets_sync.calc_hash(rows[0].as_dict())
+    assert rows[1].hash == long[sheets_sync.HEADERS.index("Hash")]
+
+
+def _http_error(status, **headers):
+    httplib2 = pytest.importorskip("httplib2")
+    response = httplib2.Response({"status": status, **headers})
+    return sheets_sync.HttpError(response, b"{}")
+
+
+def test_call_with_retry_honours_retry_after_then_jitters(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(sheets_sync.time, "sleep", sleeps.append)
+    errors = [_http_error(429, **{"retry-after": "3"}), _http_error(503)]
+
+    def flaky():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    result, retries = sheets_sync._call_with_retry(flaky, "test")
+
+    assert (result, retries) == ("ok", 2)
+    assert sleeps[0] == 3.0
+    assert sheets_sync.BACKOFF_BASE_SECONDS <= sleeps[1] <= sheets_sync.BACKOFF_CAP_SECONDS
+
+
+def test_call_with_retry_raises_non_retriable_errors(monkeypatch):
+    monkeypatch.setattr(sheets_sync.time, "sleep", lambda _delay: pytest.fail("slept"))
+
+    def forbidden():
+        raise _http_error(403)
+
+    with pytest.raises(sheets_sync.HttpError):
+        sheets_sync._call_with_retry(forbidden, "test")
+
+
+def test_coalesce_row_updates_merges_consecutive_rows():
+    def row(row_id):
+        return sheets_sync.SheetRow(row_id=row_id, values=[row_id], hash="")
+
+    data = sheets_sync._coalesce_row_updates(
+        "Inventory", [(2, row("a")), (3, row("b")), (4, row("c")), (7, row("d")), (7, row("e"))]
+    )
+
+    last = sheets_sync.INVENTORY_LAST_COLUMN
+    assert data == [
+        {"range": f"'Inventory'!A2:{last}4", "values": [["a"], ["b"], ["c"]]},
+        {"range": f"'Inventory'!A7:{last}7", "values": [["d"]]},
+        {"range": f"'Inventory'!A7:{last}7", "values": [["e"]]},
+    ]
+
+
+def test_batch_get_rows_pads_missing_value_ranges():
+    service = _BatchGetService([["RowID"], ["1"]])
+
+    assert sheets_sync._batch_get_rows(service, "sheet", ["A:A", "B:B"]) == [[["RowID"], ["1"]], []]
+
+    service.execute = lambda: {}
+    assert sheets_sync._batch_get_rows(service, "sheet", ["A:A"]) == [[]]
+
+
+def test_to_int_handles_common_cell_values():
+    assert sheets_sync._to_int(5) == 5
+    assert sheets_sync._to_int(" 7 ") == 7
+    assert sheets_sync._to_int("3.9") == 3
+    assert sheets_sync._to_int(2.5) == 2
+    assert sheets_sync._to_int("", default=4) == 4
+    assert sheets_sync._to_int("n/a", default=1) == 1
+    assert sheets_sync._to_int("inf") == 0
+    assert sheets_sync._to_int(True) == 0
+
+
+def test_rows_updated_since_parses_each_timestamp_once(monkeypatch):
+    since = sheets_sync._parse_timestamp("2024-01-01T00:00:00Z")
+    parsed = []
+    original = sheets_sync._parse_timestamp
+
+    def counting(value):
+        parsed.append(value)
+        return original(value)
+
+    monkeypatch.setattr(sheets_sync, "_parse_timestamp", counting)
+
+    def row(row_id, updated_at):
+        values = [""] * len(sheets_sync.HEADERS)
+        values[sheets_sync.HEADERS.index("UpdatedAt")] = updated_at
+        return sheets_sync.SheetRow(row_id=row_id, values=values, hash="")
+
+    rows = [row("1", "2024-02-01T00:00:00Z"), row("2", "2023-12-31T00:00:00Z"), row("3", "")]
+    rows += [row("4", "2024-02-01T00:00:00Z"), row("5", "2023-12-31T00:00:00Z")]
+
+    changed = sheets_sync._rows_updated_since(rows, since)
+
+    assert [r.row_id for r in changed] == ["1", "4"]
+    assert sorted(parsed) == ["", "2023-12-31T00:00:00Z", "2024-02-01T00:00:00Z"]
+
+
+def test_get_client_reuses_client_per_credentials_file(tmp_path, monkeypatch):
+    key_file = tmp_path / "service_account.json"
+    key_file.write_text("{}", encoding="utf-8")
+    built = []
+    monkeypatch.setattr(sheets_sync, "_CLIENTS", threading.local())
+    monkeypatch.setattr(sheets_sync, "_require_api", lambda: None)
+    monkeypatch.setattr(sheets_sync, "ensure_service_account_file", lambda path: {})
+    monkeypatch.setattr(
+        sheets_sync.service_account.Credentials,
+        "from_service_account_file",
+        lambda *args, **kwargs: object(),
+    )
+    monkeypatch.setattr(sheets_sync, "build", lambda *args, **kwargs: built.append(object()) or built[-1])
+
+    first = sheets_sync.get_client(str(key_file))
+    assert sheets_sync.get_client(str(key_file)) is first
+
+    os.utime(key_file, ns=(0, 0))
+    assert sheets_sync.get_client(str(key_file)) is not first
+    assert len(built) == 2
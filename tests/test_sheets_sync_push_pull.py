@@ -0,0 +1,670 @@
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import db
+from core import sheets_sync
+from core.offline_queue import OutboxQueue
+
+SPREADSHEET_ID = "1abcdefghijklmnopqrstuvwxyz"
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for char in letters:
+        index = index * 26 + (ord(char) - 64)
+    return index - 1
+
+
+def _parse_range(range_spec: str) -> Tuple[str, int, Optional[int], int, Optional[int]]:
+    """Return ``(title, start_col, end_col, start_row, end_row)`` (0-based, inclusive)."""
+
+    title, _, cells = range_spec.rpartition("!")
+    if title.startswith("'") and title.endswith("'"):
+        title = title[1:-1].replace("''", "'")
+    start, _, end = cells.partition(":")
+    end = end or start
+
+    def _split(ref: str) -> Tuple[Optional[int], Optional[int]]:
+        match = re.fullmatch(r"([A-Z]*)(\d*)", ref)
+        assert match, ref
+        col = _column_index(match.group(1)) if match.group(1) else None
+        row = int(match.group(2)) - 1 if match.group(2) else None
+        return col, row
+
+    start_col, start_row = _split(start)
+    end_col, end_row = _split(end)
+    return title, start_col or 0, end_col, start_row or 0, end_row
+
+
+class _Request:
+    def __init__(self, callback) -> None:
+        self._callback = callback
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        return self._callback()
+
+
+class _Values:
+    def __init__(self, service: "FakeSheetsService") -> None:
+        self._service = service
+
+    def batchGet(self, spreadsheetId: str, ranges: List[str], **kwargs: Any):  # noqa: N802
+        def _read() -> Dict[str, Any]:
+            self._service.calls.append(("values.batchGet", {"ranges": list(ranges)}))
+            return {"valueRanges": [self._service.read(spec) for spec in ranges]}
+
+        return _Request(_read)
+
+    def get(self, spreadsheetId: str, range: str, **kwargs: Any):  # noqa: N802
+        return _Request(lambda: self._service.read(range))
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict[str, Any]):  # noqa: N802
+        def _apply() -> Dict[str, Any]:
+            self._service.calls.append(("values.batchUpdate", body))
+            responses = []
+            for entry in body.get("data", []):
+                self._service.write(entry["range"], entry["values"])
+                cells = sum(len(row) for row in entry["values"])
+                responses.append({"updatedRange": entry["range"], "updatedCells": cells})
+            return {"responses": responses}
+
+        return _Request(_apply)
+
+    def update(self, spreadsheetId: str, range: str, body: Dict[str, Any], **kwargs: Any):  # noqa: N802
+        range_spec = range
+
+        def _apply() -> Dict[str, Any]:
+            self._service.calls.append(("values.update", body))
+            self._service.write(range_spec, body["values"])
+            return {}
+
+        return _Request(_apply)
+
+    def append(self, spreadsheetId: str, range: str, body: Dict[str, Any], **kwargs: Any):  # noqa: N802
+        range_spec = range
+
+        def _apply() -> Dict[str, Any]:
+            self._service.calls.append(("values.append", body))
+            title = _parse_range(range_spec)[0]
+            grid = self._service.sheets.setdefault(title, [])
+            start = len(grid)
+            grid.extend(list(row) for row in body["values"])
+            size = self._service.grid_sizes.setdefault(title, list(self._service.DEFAULT_GRID))
+            size[0] = max(size[0], len(grid))
+            return {"updates": {"updatedRange": f"'{title}'!A{start + 1}"}}
+
+        return _Request(_apply)
+
+    def clear(self, spreadsheetId: str, range: str, body: Dict[str, Any]):  # noqa: N802
+        range_spec = range
+        return _Request(lambda: self._service.clear(range_spec))
+
+
+class _Spreadsheets:
+    def __init__(self, service: "FakeSheetsService") -> None:
+        self._service = service
+
+    def values(self) -> _Values:
+        return _Values(self._service)
+
+    def get(self, spreadsheetId: str, **kwargs: Any):  # noqa: N802
+        def _metadata() -> Dict[str, Any]:
+            return {
+                "sheets": [
+                    {
+                        "properties": {
+                            "title": title,
+                            "sheetId": index,
+                            "gridProperties": self._service.grid_properties(title),
+                        }
+                    }
+                    for index, title in enumerate(self._service.sheets)
+                ]
+            }
+
+        return _Request(_metadata)
+
+    def batchUpdate(self, spreadsheetId: str, body: Dict[str, Any]):  # noqa: N802
+        def _apply() -> Dict[str, Any]:
+            self._service.calls.append(("spreadsheets.batchUpdate", body))
+            replies = []
+            titles = list(self._service.sheets)
+            for request in body.get("requests", []):
+                self._service.check_grid_bounds(request, titles)
+                update = request.get("updateCells")
+                append = request.get("appendCells")
+                dimension = request.get("appendDimension")
+                if dimension:
+                    size = self._service.grid_sizes[titles[dimension["sheetId"]]]
+                    size[0 if dimension["dimension"] == "ROWS" else 1] += dimension["length"]
+                    replies.append({})
+                    continue
+                if update and "range" in update:
+                    bounds = update["range"]
+                    grid = self._service.sheets[titles[bounds["sheetId"]]]
+                    for row in grid[bounds.get("startRowIndex", 0) : bounds.get("endRowIndex")]:
+                        stop = min(len(row), bounds.get("endColumnIndex", len(row)))
+                        for col in range(bounds.get("startColumnIndex", 0), stop):
+                            row[col] = ""
+                    replies.append({})
+                    continue
+                if update or append:
+                    payload = update or append
+                    sheet_id = payload["start"]["sheetId"] if update else payload["sheetId"]
+                    grid = self._service.sheets[titles[sheet_id]]
+                    start = payload["start"]["rowIndex"] if update else len(grid)
+                    values = [
+                        [cell["userEnteredValue"]["stringValue"] for cell in row["values"]]
+                        for row in payload["rows"]
+                    ]
+                    self._service.write(f"'{titles[sheet_id]}'!A{start + 1}", values, grow=False)
+                    replies.append({})
+                    continue
+                add = request.get("addSheet")
+                if add:
+                    title = add["properties"]["title"]
+                    grid_properties = add["properties"]["gridProperties"]
+                    self._service.sheets.setdefault(title, [])
+                    self._service.grid_sizes[title] = [
+                        grid_properties["rowCount"],
+                        grid_properties["columnCount"],
+                    ]
+                    replies.append(
+                        {
+                            "addSheet": {
+                                "properties": {
+                                    "title": title,
+                                    "sheetId": list(self._service.sheets).index(title),
+                                    "gridProperties": self._service.grid_properties(title),
+                                }
+                            }
+                        }
+                    )
+                else:
+                    replies.append({})
+            return {"replies": replies}
+
+        return _Request(_apply)
+
+
+class GridRangeError(Exception):
+    """Raised by the fake where the real API rejects a range outside the grid."""
+
+
+class FakeSheetsService:
+    """In-memory stand-in for the subset of the Sheets API used by sheets_sync.
+
+    Like the real API, values writes grow a sheet's grid while
+    ``spreadsheets.batchUpdate`` cell requests must stay inside it.
+    """
+
+    # Size of a sheet the API creates without explicit grid properties.
+    DEFAULT_GRID = (1000, 26)
+
+    def __init__(self) -> None:
+        self.sheets: Dict[str, List[List[str]]] = {}
+        self.grid_sizes: Dict[str, List[int]] = {}
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    def grid_properties(self, title: str) -> Dict[str, int]:
+        rows, columns = self.grid_sizes.setdefault(title, list(self.DEFAULT_GRID))
+        return {"rowCount": rows, "columnCount": columns}
+
+    def check_grid_bounds(self, request: Dict[str, Any], titles: List[str]) -> None:
+        payload = next(iter(request.values()))
+        if "updateCells" in request and "start" in payload:
+            start = payload["start"]
+            bounds = {
+                "sheetId": start["sheetId"],
+                "startRowIndex": start["rowIndex"],
+                "endRowIndex": start["rowIndex"] + len(payload["rows"]),
+                "startColumnIndex": start["columnIndex"],
+                "endColumnIndex": start["columnIndex"]
+                + max((len(row["values"]) for row in payload["rows"]), default=0),
+            }
+        else:
+            bounds = payload.get("range") or payload.get("filter", {}).get("range")
+        if not bounds:
+            return
+        rows, columns = self.grid_properties(titles[bounds["sheetId"]]).values()
+        start_row = bounds.get("startRowIndex", 0)
+        start_column = bounds.get("startColumnIndex", 0)
+        if start_row >= rows or bounds.get("endRowIndex", rows) > rows:
+            raise GridRangeError(f"Row range {bounds} exceeds grid of {rows} rows")
+        if start_column >= columns or bounds.get("endColumnIndex", columns) > columns:
+            raise GridRangeError(f"Column range {bounds} exceeds grid of {columns} columns")
+
+    def spreadsheets(self) -> _Spreadsheets:
+        return _Spreadsheets(self)
+
+    def read(self, range_spec: str) -> Dict[str, Any]:
+        title, start_col, end_col, start_row, end_row = _parse_range(range_spec)
+        grid = self.sheets.get(title, [])
+        stop = len(grid) if end_row is None else min(len(grid), end_row + 1)
+        values = []
+        for row in grid[start_row:stop]:
+            cells = row[start_col:] if end_col is None else row[start_col : end_col + 1]
+            while cells and cells[-1] == "":
+                cells = cells[:-1]
+            values.append(list(cells))
+        while values and not values[-1]:
+            values.pop()
+        return {"range": range_spec, "values": values}
+
+    def clear(self, range_spec: str) -> Dict[str, Any]:
+        title, start_col, end_col, start_row, end_row = _parse_range(range_spec)
+        grid = self.sheets.setdefault(title, [])
+        stop = len(grid) if end_row is None else min(len(grid), end_row + 1)
+        for row in grid[start_row:stop]:
+            last = len(row) if end_col is None else min(len(row), end_col + 1)
+            for col in range(start_col, last):
+                row[col] = ""
+        return {}
+
+    def write(self, range_spec: str, values: List[List[Any]], *, grow: bool = True) -> None:
+        title, start_col, _end_col, start_row, _end_row = _parse_range(range_spec)
+        grid = self.sheets.setdefault(title, [])
+        if grow:
+            size = self.grid_sizes.setdefault(title, list(self.DEFAULT_GRID))
+            size[0] = max(size[0], start_row + len(values))
+            size[1] = max(size[1], start_col + max((len(row) for row in values), default=0))
+        for offset, row in enumerate(values):
+            target = start_row + offset
+            while len(grid) <= target:
+                grid.append([])
+            current = grid[target]
+            needed = start_col + len(row)
+            if len(current) < needed:
+                current.extend([""] * (needed - len(current)))
+            for col, cell in enumerate(row):
+                current[start_col + col] = "" if cell is None else str(cell)
+
+    def item_rows(self, title: str = sheets_sync.DEFAULT_WORKSHEET_TITLE) -> List[Dict[str, str]]:
+        grid = self.sheets.get(title, [])
+        rows = []
+        for raw in grid[1:]:
+            if not any(raw):
+                continue
+            padded = list(raw) + [""] * (len(sheets_sync.HEADERS) - len(raw))
+            rows.append(dict(zip(sheets_sync.HEADERS, padded)))
+        return rows
+
+
+@pytest.fixture()
+def sync_env(tmp_path, monkeypatch):
+    db_path = tmp_path / "sync.db"
+    db.set_database_path(db_path)
+    db.initialize_database()
+    service = FakeSheetsService()
+    monkeypatch.setattr(sheets_sync, "get_client", lambda *args, **kwargs: service)
+    monkeypatch.setattr(sheets_sync, "_OUTBOX", OutboxQueue(tmp_path / "outbox.jsonl"))
+    monkeypatch.setattr(sheets_sync.app_paths, "BACKUP_DIR", tmp_path / "backups")
+    monkeypatch.setattr(sheets_sync, "_DEBOUNCE_STATE", {})
+    monkeypatch.setattr(sheets_sync, "_LAYOUT_CACHE", {})
+    return service, str(db_path)
+
+
+def test_push_writes_new_and_changed_rows(sync_env):
+    service, db_path = sync_env
+    first_id, _ = db.upsert_item({"rug_no": "RUG-1", "design": "Alpha", "qty": 1})
+    second_id, _ = db.upsert_item({"rug_no": "RUG-2", "design": "Beta", "qty": 2})
+
+    stats = sheets_sync.push(SPREADSHEET_ID, "unused.json", db_path=db_path)
+
+    assert stats["new"] == 2
+    assert stats["total"] == 2
+    rows = {row["RowID"]: row for row in service.item_rows()}
+    assert rows[first_id]["Design"] == "Alpha"
+    assert rows[second_id]["Qty"] == "2"
+    assert service.sheets[sheets_sync.DEFAULT_WORKSHEET_TITLE][0] == sheets_sync.HEADERS
+
+    db.upsert_item({"item_id": first_id, "design": "Gamma"})
+    sheets_sync._DEBOUNCE_STATE.clear()
+    stats = sheets_sync.push(SPREADSHEET_ID, "unused.json", db_path=db_path)
+
+    assert stats["changed"] == 1
+    assert stats["new"] == 0
+    rows = {row["RowID"]: row for row in service.item_rows()}
+    assert len(rows) == 2
+    assert rows[first_id]["Design"] == "Gamma"
+    assert rows[second_id]["Design"] == "Beta"
+
+
+def test_push_reads_only_the_row_id_column(sync_env):
+    service, db_path = sync_env
+    first_id, _ = db.upsert_item({"rug_no": "RUG-1", "design": "Alpha"})
+    db.upsert_item({"rug_no": "RUG-2", "design": "Beta"})
+    sheets_sync.push(SPREADSHEET_ID, "unused.json", db_path=db_path)
+    db.upsert_item({"item_id": first_id, "design": "Gamma"})
+    sheets_sync._DEBOUNCE_STATE.clear()
+    service.calls.clear()
+
+    sheets_sync.push(SPREADSHEET_ID, "unused.json", db_path=db_path)
+
+    read_ranges = [
+        spec for name, body in service.calls if name == "values.batchGet" for spec in body["ranges"]
+    ]
+    full_range = sheets_sync.inventory_full_range(sheets_sync.DEFAULT_WORKSHEET_TITLE)
+    assert full_range not in read_ranges
+    assert sheets_sync.inventory_row_id_range(sheets_sync.DEFAULT_WORKSHEET_TITLE) in read_ranges
+    written = [
+        entry["range"]
+        for name, body in service.calls
+        if name == "values.batchUpdate"
+        for entry in body["data"]
+    ]
+    assert sheets_sync.inventory_row_range(sheets_sync.DEFAULT_WORKSHEET_TITLE, 2) in written
+
+
+def test_pull_applies_remote_rows(sync_env):
+    service, db_path = sync_env
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, sheets_sync.DEFAULT_WORKSHEET_TITLE)
+    remote = {header: "" for header in sheets_sync.HEADERS}
+    remote.update(
+        {
+            "RowID": "REMOTE-1",
+            "RugNo": "RUG-9",
+            "Design": "Remote",
+            "Qty": "4",
+            "Status": "active",
+            "UpdatedAt": "2024-05-01T10:00:00Z",
+        }
+    )
+    service.write(
+        sheets_sync.inventory_row_range(sheets_sync.DEFAULT_WORKSHEET_TITLE, 2),
+        [[remote[header] for header in sheets_sync.HEADERS]],
+    )
+
+    stats = sheets_sync.pull(SPREADSHEET_ID, "unused.json", db_path=db_path)
+
+    assert stats == {"applied": 1, "total_remote": 1}
+    item = db.fetch_item("REMOTE-1")
+    assert item is not None
+    assert item["design"] == "Remote"
+    assert item["qty"] == 4
+
+    stats = sheets_sync.pull(SPREADSHEET_ID, "unused.json", db_path=db_path)
+    assert stats["applied"] == 0
+
+
+def test_pull_defers_missing_hashes_to_next_push(sync_env):
+    service, db_path = sync_env
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, sheets_sync.DEFAULT_WORKSHEET_TITLE)
+    remote = {header: "" for header in sheets_sync.HEADERS}
+    remote.update({"RowID": "REMOTE-2", "RugNo": "RUG-10", "UpdatedAt": "2024-05-01T10:00:00Z"})
+    service.write(
+        sheets_sync.inventory_row_range(sheets_sync.DEFAULT_WORKSHEET_TITLE, 2),
+        [[remote[header] for header in sheets_sync.HEADERS]],
+    )
+
+    sheets_sync.pull(SPREADSHEET_ID, "unused.json", db_path=db_path)
+    stats = sheets_sync.push(SPREADSHEET_ID, "unused.json", db_path=db_path)
+
+    assert stats["changed"] == 1
+    [row] = service.item_rows()
+    assert row["RowID"] == "REMOTE-2"
+    assert row["Hash"]
+
+
+def test_sync_log_is_appended_without_reading_back(sync_env):
+    service, db_path = sync_env
+    db.upsert_item({"rug_no": "RUG-1"})
+
+    sheets_sync.push(SPREADSHEET_ID, "unused.json", db_path=db_path)
+    sheets_sync.pull(SPREADSHEET_ID, "unused.json", db_path=db_path)
+
+    log = service.sheets[sheets_sync.LOG_SHEET_TITLE]
+    assert log[0] == ["Timestamp", "Action"]
+    assert log[1][1].startswith("push:")
+    assert log[2][1].startswith("pull:")
+    appends = [
+        request
+        for name, body in service.calls
+        if name == "spreadsheets.batchUpdate"
+        for request in body["requests"]
+        if "appendCells" in request
+    ]
+    assert len(appends) == 2
+    name, body = service.calls[-1]
+    assert name == "spreadsheets.batchUpdate"
+    assert [next(iter(request)) for request in body["requests"]] == ["updateCells", "appendCells"]
+    meta = dict(map(tuple, service.sheets[sheets_sync.META_SHEET_TITLE][1:]))
+    assert meta["last_pull_utc"] and meta["db_version"] == sheets_sync.APP_VERSION
+
+
+def test_latest_remote_updated_at_returns_newest_timestamp():
+    service = FakeSheetsService()
+    title = sheets_sync.DEFAULT_WORKSHEET_TITLE
+    column = sheets_sync._column_a1(sheets_sync.HEADERS.index("UpdatedAt"))
+    service.write(
+        sheets_sync._a1_range(title, f"{column}1"),
+        [["UpdatedAt"], ["2024-01-01T00:00:00Z"], [""], ["2024-03-01T12:00:00+02:00"], ["bogus"]],
+    )
+
+    latest = sheets_sync.latest_remote_updated_at(service, SPREADSHEET_ID, title)
+
+    assert latest == "2024-03-01T10:00:00Z"
+    service.sheets[title] = [["UpdatedAt"]]
+    assert sheets_sync.latest_remote_updated_at(service, SPREADSHEET_ID, title) is None
+
+
+def test_push_stamps_state_and_meta_with_one_sync_timestamp(sync_env):
+    _service, db_path = sync_env
+    for index in range(3):
+        db.upsert_item({"rug_no": f"RUG-{index}"})
+
+    sheets_sync.push(SPREADSHEET_ID, "unused.json", db_path=db_path)
+
+    with sheets_sync._connect(db_path) as conn:
+        meta = sheets_sync._read_local_meta(conn)
+        stamps = {row[0] for row in conn.execute("SELECT updated_at FROM sheet_sync_state")}
+    assert stamps == {meta["last_sync_utc"]} == {meta["last_state_update"]}
+
+
+def test_dispatch_push_batches_sends_in_parallel_and_queues_failures(sync_env, monkeypatch):
+    service, _db_path = sync_env
+    title = sheets_sync.DEFAULT_WORKSHEET_TITLE
+
+    def batch(row_id, row_index):
+        row = sheets_sync.SheetRow(row_id=row_id, values=[row_id], hash="", row_index=row_index)
+        return sheets_sync._coalesce_row_updates(title, [(row_index, row)]), [row], "rows updated"
+
+    batches = [batch(str(index), index + 2) for index in range(4)]
+    stats = sheets_sync._dispatch_push_batches(service, "unused.json", SPREADSHEET_ID, batches)
+
+    assert stats == (4, 0)
+    assert [row[0] for row in service.sheets[title][1:5]] == ["0", "1", "2", "3"]
+
+    class _Broken:
+        def spreadsheets(self):
+            raise RuntimeError("offline")
+
+    monkeypatch.setattr(sheets_sync, "get_client", lambda *args, **kwargs: _Broken())
+    with pytest.raises(sheets_sync.SpreadsheetAccessError):
+        sheets_sync._dispatch_push_batches(service, "unused.json", SPREADSHEET_ID, batches[:2])
+    queued = sheets_sync._OUTBOX.path.read_text(encoding="utf-8")
+    assert '"0"' in queued and '"1"' in queued
+
+
+def test_upsert_rows_coalesces_consecutive_rows(sync_env):
+    service, _db_path = sync_env
+    title = sheets_sync.DEFAULT_WORKSHEET_TITLE
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, title)
+    sheets_sync.upsert_rows(service, SPREADSHEET_ID, [{"RowID": "A"}, {"RowID": "B"}], title)
+    service.calls.clear()
+
+    sheets_sync.upsert_rows(
+        service,
+        SPREADSHEET_ID,
+        [{"RowID": "C", "Design": "New"}, {"RowID": "A", "Design": "First"}, {"RowID": "B"}],
+        title,
+    )
+
+    [(name, body)] = [call for call in service.calls if call[0] == "values.batchUpdate"]
+    assert [entry["range"] for entry in body["data"]] == [sheets_sync.inventory_rows_range(title, 2, 4)]
+    rows = {row["RowID"]: row for row in service.item_rows()}
+    assert (rows["A"]["Design"], rows["C"]["Design"]) == ("First", "New")
+
+
+def test_upsert_rows_reuses_existing_rows_without_reading(sync_env):
+    service, _db_path = sync_env
+    title = sheets_sync.DEFAULT_WORKSHEET_TITLE
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, title)
+    sheets_sync.upsert_rows(service, SPREADSHEET_ID, [{"RowID": "A"}, {"RowID": "B"}], title)
+    existing = sheets_sync.read_sheet_rows(service, SPREADSHEET_ID, title)
+    service.calls.clear()
+
+    sheets_sync.upsert_rows(
+        service,
+        SPREADSHEET_ID,
+        [{"RowID": "B", "Design": "Edited"}, {"RowID": "C"}],
+        title,
+        existing=existing,
+    )
+
+    assert not [call for call in service.calls if call[0] == "values.batchGet"]
+    assert [(row["RowID"], row["Design"]) for row in service.item_rows()] == [
+        ("A", ""),
+        ("B", "Edited"),
+        ("C", ""),
+    ]
+
+
+def test_pull_fetches_only_changed_rows_after_first_sync(sync_env):
+    service, db_path = sync_env
+    title = sheets_sync.DEFAULT_WORKSHEET_TITLE
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, title)
+
+    def remote_row(row_id, design, updated_at):
+        values = {header: "" for header in sheets_sync.HEADERS}
+        values.update({"RowID": row_id, "RugNo": row_id, "Design": design, "UpdatedAt": updated_at})
+        return [values[header] for header in sheets_sync.HEADERS]
+
+    service.write(
+        sheets_sync.inventory_rows_range(title, 2, 3),
+        [remote_row("R-1", "Old", "2024-05-01T10:00:00Z"), remote_row("R-2", "Old", "2024-05-01T10:00:00Z")],
+    )
+    sheets_sync.pull(SPREADSHEET_ID, "unused.json", db_path=db_path)
+    service.write(sheets_sync.inventory_row_range(title, 3), [remote_row("R-2", "New", "2999-01-01T00:00:00Z")])
+    service.calls.clear()
+
+    stats = sheets_sync.pull(SPREADSHEET_ID, "unused.json", db_path=db_path)
+
+    read_ranges = [
+        spec for name, body in service.calls if name == "values.batchGet" for spec in body["ranges"]
+    ]
+    assert sheets_sync.inventory_full_range(title) not in read_ranges
+    assert sheets_sync.inventory_rows_range(title, 3, 3) in read_ranges
+    assert stats == {"applied": 1, "total_remote": 2}
+    assert db.fetch_item("R-2")["design"] == "New"
+    assert db.fetch_item("R-1")["design"] == "Old"
+
+    markers = sheets_sync._read_remote_markers(service, SPREADSHEET_ID, title)
+    moved = [sheets_sync.SheetRow(row_id="R-1", values=[], hash="", row_index=3)]
+    assert sheets_sync._read_remote_rows_at(service, SPREADSHEET_ID, title, moved) is None
+    assert [row.row_id for row in sheets_sync._read_remote_rows_at(service, SPREADSHEET_ID, title, markers)] == [
+        "R-1",
+        "R-2",
+    ]
+
+
+def test_ensure_sheet_writes_headers_with_the_formatting_batch(sync_env):
+    service, _db_path = sync_env
+    title = sheets_sync.DEFAULT_WORKSHEET_TITLE
+
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, title)
+
+    # Freshly added sheets get their headers without being read first.
+    assert [name for name, _body in service.calls] == ["spreadsheets.batchUpdate"] * 2
+    header_writes = [request for request in service.calls[-1][1]["requests"] if "updateCells" in request]
+    assert len(header_writes) == 4
+    assert service.sheets[title][0] == sheets_sync.HEADERS
+    assert service.sheets[sheets_sync.META_SHEET_TITLE][0] == ["Key", "Value"]
+    service.calls.clear()
+
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, title)
+
+    # A layout verified moments ago is not checked again.
+    assert service.calls == []
+
+    sheets_sync._forget_sheet_layouts()
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, title)
+
+    assert [name for name, _body in service.calls] == ["values.batchGet", "spreadsheets.batchUpdate"]
+
+
+def test_ensure_sheet_widens_narrow_existing_worksheet(sync_env):
+    service, _db_path = sync_env
+    title = sheets_sync.DEFAULT_WORKSHEET_TITLE
+    service.sheets[title] = []
+    service.grid_sizes[title] = [1000, 26]
+
+    sheets_sync.ensure_sheet(service, SPREADSHEET_ID, title)
+
+    assert service.grid_sizes[title] == [1000, len(sheets_sync.HEADERS)]
+    assert service.sheets[title][0] == sheets_sync.HEADERS
+
+
+def test_customers_sheet_is_replaced_in_one_request(sync_env):
+    service, _db_path = sync_env
+    sheet_ids = sheets_sync._ensure_sheet_layout(service, SPREADSHEET_ID, sheets_sync.DEFAULT_WORKSHEET_TITLE)
+    sheet_id = sheet_ids[sheets_sync.CUSTOMER_SHEET_TITLE]
+    customers = [{"full_name": name, "phone": "555", "email": None} for name in ("Ada", "Bo", "Cy")]
+    sheets_sync._sync_customers_sheet(service, SPREADSHEET_ID, sheet_id, customers)
+    # The sheet starts with room for the header and one row; it is grown in the same request.
+    assert service.grid_sizes[sheets_sync.CUSTOMER_SHEET_TITLE][0] == 1 + len(customers)
+    service.calls.clear()
+
+    synced = sheets_sync._sync_customers_sheet(service, SPREADSHEET_ID, sheet_id, customers[:1])
+
+    assert synced == 1
+    assert [name for name, _body in service.calls] == ["spreadsheets.batchUpdate"]
+    grid = service.sheets[sheets_sync.CUSTOMER_SHEET_TITLE]
+    assert grid[1] == ["Ada", "555", ""]
+    assert not any(cell for row in grid[2:] for cell in row)
+
+
+def test_customers_sheet_follows_grid_changes_by_other_clients(sync_env):
+    service, _db_path = sync_env
+    sheet_ids = sheets_sync._ensure_sheet_layout(service, SPREADSHEET_ID, sheets_sync.DEFAULT_WORKSHEET_TITLE)
+    sheet_id = sheet_ids[sheets_sync.CUSTOMER_SHEET_TITLE]
+    title = sheets_sync.CUSTOMER_SHEET_TITLE
+    sheets_sync._sync_customers_sheet(service, SPREADSHEET_ID, sheet_id, [{"full_name": "Ada"}])
+
+    # Another client pushes 50 customers, growing the grid behind our back.
+    service.write(f"'{title}'!A2", [[f"Other {index}", "555", ""] for index in range(50)])
+    sheets_sync._sync_customers_sheet(service, SPREADSHEET_ID, sheet_id, [{"full_name": "Bo"}])
+
+    grid = service.sheets[title]
+    assert grid[1][0] == "Bo"
+    assert not any(cell for row in grid[2:] for cell in row)
+
+    # Someone deletes rows, shrinking the grid; the clear must stay inside it.
+    del grid[3:]
+    service.grid_sizes[title][0] = 3
+    sheets_sync._sync_customers_sheet(service, SPREADSHEET_ID, sheet_id, [{"full_name": "Cy"}])
+
+    assert service.sheets[title][1][0] == "Cy"
+
+
+def test_write_check_writes_and_restores_in_one_request(sync_env):
+    service, _db_path = sync_env
+    title = sheets_sync.DEFAULT_WORKSHEET_TITLE
+    service.write(f"'{title}'!Z1", [["keep"]])
+
+    result = sheets_sync._perform_write_check(service, SPREADSHEET_ID, title, "")
+
+    assert result == "ok"
+    assert [name for name, _body in service.calls] == ["values.batchGet", "values.batchUpdate"]
+    assert len(service.calls[-1][1]["data"]) == 2
+    assert service.sheets[title][0][25] == "keep"
@@ -65,3 +65,37 @@ def test_sheets_client_range_uses_dynamic_last_column():
     assert sheets_client.a1_headers_range("items", columns=columns) == "'items'!A1:AG1"
     assert sheets_client.a1_row_range("items", 5, columns=columns) == "'items'!A5:AG5"
     assert sheets_client.a1_full_column_range("items", columns=80) == "'items'!A:CB"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("https://docs.google.com/spreadsheets/d/1AbcDEF_ghi-JKLmnop/edit#gid=0", "1AbcDEF_ghi-JKLmnop"),
+        ("https://docs.google.com/spreadsheets/d/1AbcDEF_ghi-JKLmnop?usp=sharing", "1AbcDEF_ghi-JKLmnop"),
+        (" 1AbcDEF_ghi-JKLmnop#gid=5 ", "1AbcDEF_ghi-JKLmnop"),
+        ("1AbcDEF_ghi-JKLmnop", "1AbcDEF_ghi-JKLmnop"),
+        ("", ""),
+    ],
+)
+def test_parse_spreadsheet_id_extracts_identifier(raw, expected):
+    assert sheets_sync.parse_spreadsheet_id(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["C:\\data\\stock.xlsx", "folder/1AbcDEF_ghi-JKLmnop", "short", "1AbcDEF_ghi-JK"])
+def test_parse_spreadsheet_id_rejects_paths_and_short_values(raw):
+    with pytest.raises(sheets_sync.SpreadsheetAccessError):
+        sheets_sync.parse_spreadsheet_id(raw)
+
+
+def test_ensure_sheet_accepts_spreadsheet_urls(monkeypatch):
+    calls = []
+
+    def fake_structure(service, spreadsheet_id, worksheet_title):
+        calls.append((spreadsheet_id, worksheet_title))
+        return 7
+
+    monkeypatch.setattr(sheets_sync, "_ensure_sheet_structure", fake_structure)
+    url = "https://docs.google.com/spreadsheets/d/1AbcDEF_ghi-JKLmnop/edit#gid=0"
+
+    assert sheets_sync.ensure_sheet(object(), url, " Inventory ") == 7
+    assert calls == [("1AbcDEF_ghi-JKLmnop", "Inventory")]